@@ -3,25 +3,35 @@
 from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Response
 
+from app.responses import ORJSONResponse
 from app.services.analytics import AnalyticsEngine, Period
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
-engine = AnalyticsEngine()
+_engine = AnalyticsEngine()
+
+
+async def get_engine() -> AnalyticsEngine:
+    return _engine
+
 
 # In a real app, orders come from the database.
 # Here we define the endpoints and accept orders as POST body for demo.
+#
+# The handlers are plain ``def``: the engine is pure CPU-bound Python, so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
 
 
 @router.post("/report")
-async def generate_report(
+def generate_report(
     orders: list[dict],
     period: Period = Query(Period.MONTHLY, description="Aggregation period"),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     top_n: int = Query(10, ge=1, le=100),
     forecast_periods: int = Query(3, ge=0, le=12),
+    engine: AnalyticsEngine = Depends(get_engine),
 ):
     """Generate a full analytics report from order data."""
     report = engine.generate_report(
@@ -32,66 +42,50 @@ async def generate_report(
         top_n=top_n,
         forecast_periods=forecast_periods,
     )
-    return engine.report_to_dict(report)
+    return Response(engine.report_to_json(report), media_type="application/json")
 
 
 @router.post("/top-products")
-async def top_products(
+def top_products(
     orders: list[dict],
     limit: int = Query(10, ge=1, le=100),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    engine: AnalyticsEngine = Depends(get_engine),
 ):
     """Get top-selling products ranked by revenue."""
-    tops = engine.top_products(orders, limit, start_date, end_date)
-    return [
-        {
-            "sku": tp.sku,
-            "title": tp.title,
-            "units_sold": tp.units_sold,
-            "revenue": str(tp.revenue),
-            "order_count": tp.order_count,
-        }
-        for tp in tops
-    ]
+    return ORJSONResponse(engine.top_products(orders, limit, start_date, end_date))
 
 
 @router.post("/platform-breakdown")
-async def platform_breakdown(
+def platform_breakdown(
     orders: list[dict],
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    engine: AnalyticsEngine = Depends(get_engine),
 ):
     """Revenue breakdown by platform."""
-    breakdown = engine.platform_breakdown(orders, start_date, end_date)
-    return [
-        {
-            "platform": pb.platform,
-            "order_count": pb.order_count,
-            "revenue": str(pb.revenue),
-            "share_pct": str(pb.share_pct),
-            "avg_order_value": str(pb.avg_order_value),
-        }
-        for pb in breakdown
-    ]
+    return ORJSONResponse(engine.platform_breakdown(orders, start_date, end_date))
 
 
 @router.post("/customer-ltv")
-async def customer_ltv(
+def customer_ltv(
     orders: list[dict],
     limit: int = Query(20, ge=1, le=100),
+    engine: AnalyticsEngine = Depends(get_engine),
 ):
     """Customer lifetime value ranking."""
     customers = engine.customer_ltv(orders, limit)
-    return [
+    # Decimals are rendered as strings by ORJSONResponse
+    return ORJSONResponse([
         {
             "customer_id": cv.customer_id,
             "customer_name": cv.customer_name,
             "total_orders": cv.total_orders,
-            "total_spent": str(cv.total_spent),
-            "avg_order_value": str(cv.avg_order_value),
-            "frequency_per_30d": str(cv.frequency),
+            "total_spent": cv.total_spent,
+            "avg_order_value": cv.avg_order_value,
+            "frequency_per_30d": cv.frequency,
             "lifetime_days": cv.lifetime_days,
         }
         for cv in customers
-    ]
+    ])
@@ -1,5 +1,8 @@
 """Auth API — login, token refresh, current user."""
 
+import hmac
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
@@ -15,6 +18,14 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
 
 
+# bcrypt is deliberately slow (~200ms): hash the configured admin password on
+# the first login rather than per attempt, and not at import so startup
+# doesn't pay for it.
+@lru_cache(maxsize=1)
+def _admin_password_hash() -> str:
+    return hash_password(settings.admin_password)
+
+
 class LoginRequest(BaseModel):
     email: str
     password: str
@@ -31,15 +42,15 @@ class UserInfo(BaseModel):
     role: str = "admin"
 
 
+# Sync on purpose: bcrypt is CPU-bound, so the handler runs in the threadpool
+# instead of stalling the event loop for every other request.
 @router.post("/login", response_model=TokenResponse)
-async def login(data: LoginRequest):
+def login(data: LoginRequest):
     """Authenticate and return JWT."""
-    if data.email != settings.admin_email:
+    if not hmac.compare_digest(data.email.encode("utf-8"), settings.admin_email.encode("utf-8")):
+        raise HTTPException(401, "Invalid credentials")
+    if not verify_password(data.password, _admin_password_hash()):
         raise HTTPException(401, "Invalid credentials")
-    if not verify_password(data.password, hash_password(settings.admin_password)):
-        # For demo: compare plain text since we don't store hashed admin pw
-        if data.password != settings.admin_password:
-            raise HTTPException(401, "Invalid credentials")
 
     token = create_access_token({"sub": data.email, "role": "admin"})
     return TokenResponse(
@@ -1,20 +1,53 @@
 """Bulk import/export API endpoints."""
 
-from fastapi import APIRouter, File, Query, UploadFile
-from fastapi.responses import PlainTextResponse
+import hashlib
+import io
+
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from app.services.bulk_ops import BulkExporter, BulkImporter
 
 router = APIRouter(prefix="/bulk", tags=["bulk"])
-importer = BulkImporter()
-exporter = BulkExporter()
+
+# Import handlers are sync so the CPU-bound parsing/validation runs in the
+# threadpool; exports stream from sync generators, which Starlette also
+# iterates off the event loop.
+_importer = BulkImporter()
+_exporter = BulkExporter()
+
+
+async def get_importer() -> BulkImporter:
+    return _importer
+
+
+async def get_exporter() -> BulkExporter:
+    return _exporter
+
+
+# Templates are constant per entity: render once, serve the bytes with a
+# long-lived ETag.
+TEMPLATE_MAX_AGE = 86400
+_TEMPLATES = {
+    entity: _exporter.generate_template(entity).encode("utf-8")
+    for entity in ("products", "orders")
+}
+_TEMPLATE_ETAGS = {
+    entity: '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    for entity, body in _TEMPLATES.items()
+}
+
+
+def _text_stream(file: UploadFile) -> io.TextIOWrapper:
+    """Decode the spooled upload lazily instead of reading it into one string."""
+    file.file.seek(0)
+    return io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
 
 
 @router.post("/import/products/csv")
-async def import_products_csv(file: UploadFile = File(...)):
+def import_products_csv(file: UploadFile = File(...), importer: BulkImporter = Depends(get_importer)):
     """Bulk import products from a CSV file."""
-    content = (await file.read()).decode("utf-8-sig")
-    result = importer.import_products_csv(content)
+    result = importer.import_products_csv_stream(_text_stream(file))
     return {
         "summary": result.summary(),
         "errors": [
@@ -27,10 +60,9 @@ async def import_products_csv(file: UploadFile = File(...)):
 
 
 @router.post("/import/products/json")
-async def import_products_json(file: UploadFile = File(...)):
+def import_products_json(file: UploadFile = File(...), importer: BulkImporter = Depends(get_importer)):
     """Bulk import products from a JSON file."""
-    content = (await file.read()).decode("utf-8")
-    result = importer.import_products_json(content)
+    result = importer.import_products_json(file.file.read())
     return {
         "summary": result.summary(),
         "errors": [
@@ -43,10 +75,9 @@ async def import_products_json(file: UploadFile = File(...)):
 
 
 @router.post("/import/orders/csv")
-async def import_orders_csv(file: UploadFile = File(...)):
+def import_orders_csv(file: UploadFile = File(...), importer: BulkImporter = Depends(get_importer)):
     """Bulk import orders from a CSV file."""
-    content = (await file.read()).decode("utf-8-sig")
-    result = importer.import_orders_csv(content)
+    result = importer.import_orders_csv_stream(_text_stream(file))
     return {
         "summary": result.summary(),
         "errors": [
@@ -57,24 +88,26 @@ async def import_orders_csv(file: UploadFile = File(...)):
 
 
 @router.get("/template/{entity}", response_class=PlainTextResponse)
-async def download_template(entity: str = "products"):
+async def download_template(request: Request, entity: str = "products"):
     """Download a CSV import template (products or orders)."""
-    if entity not in ("products", "orders"):
+    body = _TEMPLATES.get(entity)
+    if body is None:
         return PlainTextResponse("Entity must be 'products' or 'orders'", status_code=400)
-    template = exporter.generate_template(entity)
-    return PlainTextResponse(
-        template,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={entity}_template.csv"},
-    )
+    headers = {
+        "ETag": _TEMPLATE_ETAGS[entity],
+        "Cache-Control": f"public, max-age={TEMPLATE_MAX_AGE}",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f"attachment; filename={entity}_template.csv"
+    return Response(body, media_type="text/csv", headers=headers)
 
 
-@router.post("/export/products/csv", response_class=PlainTextResponse)
-async def export_products_csv(products: list[dict]):
+@router.post("/export/products/csv", response_class=StreamingResponse)
+async def export_products_csv(products: list[dict], exporter: BulkExporter = Depends(get_exporter)):
     """Export products to CSV."""
-    csv_content = exporter.products_to_csv(products)
-    return PlainTextResponse(
-        csv_content,
+    return StreamingResponse(
+        exporter.iter_products_csv(products),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=products_export.csv"},
     )
@@ -84,11 +117,11 @@ async def export_products_csv(products: list[dict]):
 async def export_products_json(
     products: list[dict],
     pretty: bool = Query(True),
+    exporter: BulkExporter = Depends(get_exporter),
 ):
     """Export products to JSON."""
-    json_content = exporter.products_to_json(products, pretty)
-    return PlainTextResponse(
-        json_content,
+    return StreamingResponse(
+        exporter.iter_products_json(products, pretty),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=products_export.json"},
     )
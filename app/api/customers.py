@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr, Field
 
 from app.services.customer import CustomerData, CustomerManager, InteractionData
@@ -14,7 +14,9 @@ router = APIRouter(prefix="/customers", tags=["customers"])
 _manager = CustomerManager()
 
 
-def get_manager() -> CustomerManager:
+# Injected with Depends so tests can swap it via app.dependency_overrides.
+# Async so FastAPI resolves it inline rather than via the threadpool.
+async def get_manager() -> CustomerManager:
     return _manager
 
 
@@ -62,8 +64,7 @@ class InteractionStatusUpdate(BaseModel):
 # --- Customer CRUD ---
 
 @router.post("/", status_code=201)
-async def create_customer(body: CustomerCreate):
-    mgr = get_manager()
+async def create_customer(body: CustomerCreate, mgr: CustomerManager = Depends(get_manager)):
     try:
         data = CustomerData(
             email=body.email,
@@ -91,26 +92,23 @@ async def list_customers(
     min_orders: int = 0,
     sort_by: str = "total_spent",
     limit: int = 100,
+    mgr: CustomerManager = Depends(get_manager),
 ):
-    mgr = get_manager()
     return mgr.list_customers(tier, country, active_only, tag, min_orders, sort_by, limit)
 
 
 @router.get("/search")
-async def search_customers(q: str):
-    mgr = get_manager()
+async def search_customers(q: str, mgr: CustomerManager = Depends(get_manager)):
     return mgr.search_customers(q)
 
 
 @router.get("/stats")
-async def customer_stats():
-    mgr = get_manager()
+async def customer_stats(mgr: CustomerManager = Depends(get_manager)):
     return mgr.stats()
 
 
 @router.get("/{email}")
-async def get_customer(email: str):
-    mgr = get_manager()
+async def get_customer(email: str, mgr: CustomerManager = Depends(get_manager)):
     c = mgr.get_customer(email)
     if not c:
         raise HTTPException(status_code=404, detail="Customer not found")
@@ -118,16 +116,14 @@ async def get_customer(email: str):
 
 
 @router.delete("/{email}")
-async def deactivate_customer(email: str):
-    mgr = get_manager()
+async def deactivate_customer(email: str, mgr: CustomerManager = Depends(get_manager)):
     if not mgr.deactivate_customer(email):
         raise HTTPException(status_code=404, detail="Customer not found")
     return {"status": "deactivated", "email": email}
 
 
 @router.put("/{email}/tier")
-async def update_tier(email: str, body: TierUpdate):
-    mgr = get_manager()
+async def update_tier(email: str, body: TierUpdate, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.set_tier(email, body.tier)
     except ValueError as e:
@@ -135,8 +131,7 @@ async def update_tier(email: str, body: TierUpdate):
 
 
 @router.post("/{email}/tags")
-async def add_tags(email: str, body: TagsAdd):
-    mgr = get_manager()
+async def add_tags(email: str, body: TagsAdd, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.add_tags(email, body.tags)
     except ValueError as e:
@@ -144,8 +139,7 @@ async def add_tags(email: str, body: TagsAdd):
 
 
 @router.post("/{email}/order")
-async def record_order(email: str, body: OrderRecord):
-    mgr = get_manager()
+async def record_order(email: str, body: OrderRecord, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.record_order(email, body.order_total)
     except ValueError as e:
@@ -153,8 +147,7 @@ async def record_order(email: str, body: OrderRecord):
 
 
 @router.post("/{email}/return")
-async def record_return(email: str):
-    mgr = get_manager()
+async def record_return(email: str, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.record_return(email)
     except ValueError as e:
@@ -162,8 +155,7 @@ async def record_return(email: str):
 
 
 @router.get("/{email}/health")
-async def health_score(email: str):
-    mgr = get_manager()
+async def health_score(email: str, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.customer_health_score(email)
     except ValueError as e:
@@ -173,8 +165,7 @@ async def health_score(email: str):
 # --- Interactions ---
 
 @router.post("/{email}/interactions", status_code=201)
-async def create_interaction(email: str, body: InteractionCreate):
-    mgr = get_manager()
+async def create_interaction(email: str, body: InteractionCreate, mgr: CustomerManager = Depends(get_manager)):
     try:
         data = InteractionData(
             customer_email=email,
@@ -197,14 +188,13 @@ async def list_interactions(
     interaction_type: Optional[str] = None,
     status: Optional[str] = None,
     sentiment: Optional[str] = None,
+    mgr: CustomerManager = Depends(get_manager),
 ):
-    mgr = get_manager()
     return mgr.list_interactions(email, interaction_type, status, sentiment)
 
 
 @router.put("/interactions/{interaction_id}/status")
-async def update_interaction_status(interaction_id: str, body: InteractionStatusUpdate):
-    mgr = get_manager()
+async def update_interaction_status(interaction_id: str, body: InteractionStatusUpdate, mgr: CustomerManager = Depends(get_manager)):
     try:
         return mgr.update_interaction_status(interaction_id, body.status)
     except ValueError as e:
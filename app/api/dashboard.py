@@ -1,51 +1,77 @@
 """Dashboard stats API."""
 
-from decimal import Decimal
+import asyncio
+import hashlib
+import time
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import InventoryItem, Order, Product, Supplier
+from app.responses import ORJSONResponse
 from app.schemas import DashboardStats
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+STATS_TTL_SECONDS = 5
+
+# All counters as scalar subqueries of a single SELECT — one round-trip.
+_STATS_STMT = select(
+    select(func.count(Product.id)).scalar_subquery().label("total_products"),
+    select(func.count(Product.id)).where(Product.active.is_(True))
+    .scalar_subquery().label("active_products"),
+    select(func.count(Order.id)).scalar_subquery().label("total_orders"),
+    select(func.count(Order.id)).where(Order.status == "pending")
+    .scalar_subquery().label("pending_orders"),
+    select(func.coalesce(func.sum(Order.total), 0)).scalar_subquery().label("total_revenue"),
+    # count(*) over the partial-index predicate: answerable from the low-stock
+    # index without reading id values from the heap
+    select(func.count()).select_from(InventoryItem).where(InventoryItem.is_low_stock)
+    .scalar_subquery().label("low_stock_count"),
+    select(func.count(Supplier.id)).scalar_subquery().label("total_suppliers"),
+)
+
+# (stats, etag, expires_at) — shared by all pollers until the TTL lapses.
+_stats_cache: tuple[dict, str, float] | None = None
+_stats_lock = asyncio.Lock()
+
+
+def reset_stats_cache() -> None:
+    """Drop the cached stats so the next request hits the database."""
+    global _stats_cache
+    _stats_cache = None
+
+
+def _fresh_cache() -> tuple[dict, str, float] | None:
+    cached = _stats_cache
+    if cached and cached[2] > time.monotonic():
+        return cached
+    return None
+
+
+async def _get_cached_stats(db: AsyncSession) -> tuple[dict, str]:
+    global _stats_cache
+    cached = _fresh_cache()
+    if cached is None:
+        # Only lock on a miss, so concurrent pollers share one recomputation.
+        async with _stats_lock:
+            cached = _fresh_cache()
+            if cached is None:
+                row = (await db.execute(_STATS_STMT)).one()
+                stats = DashboardStats(**row._mapping).model_dump(mode="json")
+                digest = hashlib.blake2b(orjson.dumps(stats), digest_size=16).hexdigest()
+                cached = (stats, f'"{digest}"', time.monotonic() + STATS_TTL_SECONDS)
+                _stats_cache = cached
+    return cached[0], cached[1]
+
 
 @router.get("/stats", response_model=DashboardStats)
-async def get_stats(db: AsyncSession = Depends(get_db)):
-    total_products = (await db.execute(select(func.count(Product.id)))).scalar() or 0
-    active_products = (
-        await db.execute(select(func.count(Product.id)).where(Product.active.is_(True)))
-    ).scalar() or 0
-
-    total_orders = (await db.execute(select(func.count(Order.id)))).scalar() or 0
-    pending_orders = (
-        await db.execute(select(func.count(Order.id)).where(Order.status == "pending"))
-    ).scalar() or 0
-
-    total_revenue = (
-        await db.execute(select(func.coalesce(func.sum(Order.total), 0)))
-    ).scalar() or Decimal("0")
-
-    # Low stock count
-    low_stock = (
-        await db.execute(
-            select(func.count(InventoryItem.id)).where(
-                (InventoryItem.quantity - InventoryItem.reserved) <= InventoryItem.low_stock_threshold
-            )
-        )
-    ).scalar() or 0
-
-    total_suppliers = (await db.execute(select(func.count(Supplier.id)))).scalar() or 0
-
-    return DashboardStats(
-        total_products=total_products,
-        active_products=active_products,
-        total_orders=total_orders,
-        pending_orders=pending_orders,
-        total_revenue=total_revenue,
-        low_stock_count=low_stock,
-        total_suppliers=total_suppliers,
-    )
+async def get_stats(request: Request, db: AsyncSession = Depends(get_db)):
+    stats, etag = await _get_cached_stats(db)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={STATS_TTL_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(stats, headers=headers)
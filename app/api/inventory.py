@@ -3,12 +3,14 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.database import get_db
 from app.models import InventoryItem
-from app.schemas import InventoryOut, InventoryUpdate
+from app.responses import adapter_response
+from app.schemas import INVENTORY_LIST, InventoryOut, InventoryUpdate
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
@@ -19,15 +21,14 @@ async def list_inventory(
     low_stock: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(InventoryItem)
+    # The response schema has no relationships; fail loudly rather than lazy-load per row
+    stmt = select(InventoryItem).options(raiseload("*"))
     if warehouse:
         stmt = stmt.where(InventoryItem.warehouse == warehouse)
     if low_stock:
-        stmt = stmt.where(
-            (InventoryItem.quantity - InventoryItem.reserved) <= InventoryItem.low_stock_threshold
-        )
+        stmt = stmt.where(InventoryItem.is_low_stock)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return adapter_response(INVENTORY_LIST, result.scalars().all())
 
 
 @router.get("/{item_id}", response_model=InventoryOut)
@@ -58,13 +59,20 @@ async def adjust_stock(
     delta: int = Query(..., description="Positive to add, negative to subtract"),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
-    item = result.scalar_one_or_none()
-    if not item:
-        raise HTTPException(404, "Inventory item not found")
-    new_qty = item.quantity + delta
-    if new_qty < 0:
+    # Check and apply in one statement, so concurrent adjustments cannot
+    # both pass the non-negative check.
+    result = await db.execute(
+        update(InventoryItem)
+        .where(InventoryItem.id == item_id, InventoryItem.quantity + delta >= 0)
+        .values(quantity=InventoryItem.quantity + delta)
+        .returning(InventoryItem.quantity)
+    )
+    new_qty = result.scalar_one_or_none()
+    if new_qty is None:
+        await db.rollback()
+        found = await db.execute(select(InventoryItem.id).where(InventoryItem.id == item_id))
+        if found.scalar_one_or_none() is None:
+            raise HTTPException(404, "Inventory item not found")
         raise HTTPException(400, "Stock cannot go below zero")
-    item.quantity = new_qty
     await db.commit()
     return {"item_id": str(item_id), "new_quantity": new_qty}
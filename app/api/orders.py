@@ -1,44 +1,55 @@
 """Order CRUD API."""
 
-import uuid as uuid_mod
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.database import get_db
 from app.models import Order, OrderItem, Product
-from app.schemas import OrderCreate, OrderOut, OrderUpdate
+from app.responses import adapter_response
+from app.schemas import ORDER_LIST, OrderCreate, OrderOut, OrderStatusName, OrderUpdate
+from app.utils.uuid7 import uuid7
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
 def _generate_order_number() -> str:
-    return f"ORD-{uuid_mod.uuid4().hex[:8].upper()}"
+    # Leading 12 hex digits are the ms timestamp, so numbers sort by creation
+    # time and land at the right edge of the unique index.
+    return f"ORD-{uuid7().hex[:20].upper()}"
 
 
 @router.get("/", response_model=list[OrderOut])
 async def list_orders(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    status: str | None = None,
+    status: OrderStatusName | None = None,
     platform: str | None = None,
+    order_number: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Order)
+    # The response schema has no relationships; fail loudly rather than lazy-load per row
+    stmt = select(Order).options(raiseload("*"))
+    if order_number:
+        # Literal prefix match; served by the "C"-collated unique index
+        pattern = order_number.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        stmt = stmt.where(Order.order_number.like(pattern, escape="\\"))
     if status:
         stmt = stmt.where(Order.status == status)
     if platform:
         stmt = stmt.where(Order.platform == platform)
     stmt = stmt.order_by(Order.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return adapter_response(ORDER_LIST, result.scalars().all())
 
 
 @router.post("/", response_model=OrderOut, status_code=201)
 async def create_order(data: OrderCreate, db: AsyncSession = Depends(get_db)):
-    subtotal = sum(i.unit_price * i.quantity for i in data.items)
+    line_totals = [i.unit_price * i.quantity for i in data.items]
+    subtotal = sum(line_totals)
     total = subtotal + data.shipping_cost + data.tax
 
     order = Order(
@@ -58,21 +69,26 @@ async def create_order(data: OrderCreate, db: AsyncSession = Depends(get_db)):
     db.add(order)
     await db.flush()
 
-    for item in data.items:
-        # Try to find product by SKU
-        result = await db.execute(select(Product).where(Product.sku == item.sku))
-        product = result.scalar_one_or_none()
-
-        order_item = OrderItem(
-            order_id=order.id,
-            product_id=product.id if product else None,
-            sku=item.sku,
-            title=item.title or (product.title if product else ""),
-            quantity=item.quantity,
-            unit_price=item.unit_price,
-            total_price=item.unit_price * item.quantity,
-        )
-        db.add(order_item)
+    if data.items:
+        # Resolve every SKU in one round-trip instead of one query per line item
+        skus = {item.sku for item in data.items}
+        result = await db.execute(select(Product).where(Product.sku.in_(skus)))
+        by_sku = {p.sku: p for p in result.scalars()}
+
+        rows = []
+        for item, line_total in zip(data.items, line_totals):
+            product = by_sku.get(item.sku)
+            rows.append({
+                "order_id": order.id,
+                "product_id": product.id if product else None,
+                "sku": item.sku,
+                "title": item.title or (product.title if product else ""),
+                "quantity": item.quantity,
+                "unit_price": item.unit_price,
+                "total_price": line_total,
+            })
+        # A single executemany INSERT for all line items
+        await db.execute(insert(OrderItem), rows)
 
     await db.commit()
     await db.refresh(order)
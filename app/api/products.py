@@ -5,10 +5,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.database import get_db
 from app.models import Product
-from app.schemas import ProductCreate, ProductOut, ProductUpdate
+from app.responses import adapter_response
+from app.schemas import PRODUCT_LIST, ProductCreate, ProductOut, ProductUpdate
 
 router = APIRouter(prefix="/products", tags=["products"])
 
@@ -21,16 +23,19 @@ async def list_products(
     q: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Product)
+    # The response schema has no relationships; fail loudly rather than lazy-load per row
+    stmt = select(Product).options(raiseload("*"))
     if active is not None:
         stmt = stmt.where(Product.active == active)
     if q:
+        # Escape LIKE wildcards so q is matched literally; served by the trigram indexes
+        pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
         stmt = stmt.where(
-            Product.title.ilike(f"%{q}%") | Product.sku.ilike(f"%{q}%")
+            Product.title.ilike(pattern, escape="\\") | Product.sku.ilike(pattern, escape="\\")
         )
     stmt = stmt.order_by(Product.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return adapter_response(PRODUCT_LIST, result.scalars().all())
 
 
 @router.post("/", response_model=ProductOut, status_code=201)
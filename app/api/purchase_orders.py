@@ -1,15 +1,18 @@
 """Purchase Order management API."""
 
-import uuid as uuid_mod
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.database import get_db
-from app.models import PurchaseOrder, Supplier
+from app.models import PurchaseOrder, PurchaseOrderItem, Supplier
+from app.responses import ORJSONResponse
+from app.schemas import POStatusName
+from app.utils.uuid7 import uuid7
 
 router = APIRouter(prefix="/purchase-orders", tags=["purchase_orders"])
 
@@ -29,7 +32,7 @@ class POCreate(BaseModel):
 
 
 class POUpdate(BaseModel):
-    status: str | None = None
+    status: POStatusName | None = None
     notes: str | None = None
     expected_date: str | None = None
 
@@ -49,40 +52,64 @@ class POOut(BaseModel):
 
     @classmethod
     def from_orm_model(cls, po: PurchaseOrder) -> "POOut":
-        return cls(
-            id=po.id,
-            po_number=po.po_number,
-            supplier_id=po.supplier_id,
-            status=po.status.value if hasattr(po.status, "value") else str(po.status),
-            items=po.items or [],
-            total_cost=float(po.total_cost or 0),
-            currency=po.currency or "CNY",
-            notes=po.notes or "",
-            created_at=po.created_at.isoformat() if po.created_at else "",
-        )
+        # Every field is normalised by _po_dict, so skip re-validation.
+        return cls.model_construct(**_po_dict(po))
+
+
+def _po_dict(po: PurchaseOrder) -> dict:
+    """Plain POOut-shaped dict; the status column already loads as its name."""
+    return {
+        "id": po.id,
+        "po_number": po.po_number,
+        "supplier_id": po.supplier_id,
+        "status": po.status,
+        "items": [
+            {"sku": i.sku, "quantity": i.quantity, "unit_cost": float(i.unit_cost or 0)}
+            for i in po.items
+        ],
+        "total_cost": float(po.total_cost or 0),
+        "currency": po.currency or "CNY",
+        "notes": po.notes or "",
+        "created_at": po.created_at.isoformat() if po.created_at else "",
+    }
+
+
+# Line items live in purchase_order_items; load them for every PO in one IN query.
+_PO_STMT = select(PurchaseOrder).options(selectinload(PurchaseOrder.items))
+
+
+async def _get_po(db: AsyncSession, po_id: UUID) -> PurchaseOrder:
+    result = await db.execute(_PO_STMT.where(PurchaseOrder.id == po_id))
+    po = result.scalar_one_or_none()
+    if not po:
+        raise HTTPException(404, "Purchase order not found")
+    return po
 
 
 def _generate_po_number() -> str:
-    return f"PO-{uuid_mod.uuid4().hex[:8].upper()}"
+    # Leading 12 hex digits are the ms timestamp, so numbers sort by creation
+    # time and land at the right edge of the unique index.
+    return f"PO-{uuid7().hex[:20].upper()}"
 
 
-@router.get("/")
+@router.get("/", response_model=list[POOut])
 async def list_purchase_orders(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    status: str | None = None,
+    status: POStatusName | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(PurchaseOrder)
+    stmt = _PO_STMT
     if status:
         stmt = stmt.where(PurchaseOrder.status == status)
     stmt = stmt.order_by(PurchaseOrder.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(stmt)
-    pos = result.scalars().all()
-    return [POOut.from_orm_model(po) for po in pos]
+    # Encode plain dicts straight to bytes with orjson instead of building a
+    # POOut per row; response_model still documents the shape.
+    return ORJSONResponse([_po_dict(po) for po in result.scalars()])
 
 
-@router.post("/", status_code=201)
+@router.post("/", response_model=POOut, status_code=201)
 async def create_purchase_order(data: POCreate, db: AsyncSession = Depends(get_db)):
     # Verify supplier exists
     result = await db.execute(select(Supplier).where(Supplier.id == data.supplier_id))
@@ -90,42 +117,39 @@ async def create_purchase_order(data: POCreate, db: AsyncSession = Depends(get_d
     if not supplier:
         raise HTTPException(404, "Supplier not found")
 
-    items_list = [item.model_dump() for item in data.items]
-    total = sum(i["quantity"] * i["unit_cost"] for i in items_list)
+    total = sum(i.quantity * i.unit_cost for i in data.items)
 
     po = PurchaseOrder(
         po_number=_generate_po_number(),
         supplier_id=data.supplier_id,
-        items=items_list,
         total_cost=total,
         currency=data.currency,
         notes=data.notes,
     )
     db.add(po)
+    await db.flush()
+    if data.items:
+        await db.execute(
+            insert(PurchaseOrderItem),
+            [{"purchase_order_id": po.id, **item.model_dump()} for item in data.items],
+        )
     await db.commit()
-    await db.refresh(po)
-    return POOut.from_orm_model(po)
+    return POOut.from_orm_model(await _get_po(db, po.id))
 
 
-@router.get("/{po_id}")
+@router.get("/{po_id}", response_model=POOut)
 async def get_purchase_order(po_id: UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(PurchaseOrder).where(PurchaseOrder.id == po_id))
-    po = result.scalar_one_or_none()
-    if not po:
-        raise HTTPException(404, "Purchase order not found")
+    po = await _get_po(db, po_id)
     return POOut.from_orm_model(po)
 
 
-@router.patch("/{po_id}")
+@router.patch("/{po_id}", response_model=POOut)
 async def update_purchase_order(
     po_id: UUID,
     data: POUpdate,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(PurchaseOrder).where(PurchaseOrder.id == po_id))
-    po = result.scalar_one_or_none()
-    if not po:
-        raise HTTPException(404, "Purchase order not found")
+    po = await _get_po(db, po_id)
 
     if data.status:
         po.status = data.status
@@ -136,16 +160,13 @@ async def update_purchase_order(
     return POOut.from_orm_model(po)
 
 
-@router.post("/{po_id}/receive")
+@router.post("/{po_id}/receive", response_model=POOut)
 async def receive_purchase_order(
     po_id: UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Mark a PO as received."""
-    result = await db.execute(select(PurchaseOrder).where(PurchaseOrder.id == po_id))
-    po = result.scalar_one_or_none()
-    if not po:
-        raise HTTPException(404, "Purchase order not found")
+    po = await _get_po(db, po_id)
     if po.status not in ("draft", "sent", "confirmed", "shipped"):
         raise HTTPException(400, f"Cannot receive PO in '{po.status}' status")
 
@@ -159,10 +180,7 @@ async def receive_purchase_order(
 
 @router.delete("/{po_id}", status_code=204)
 async def delete_purchase_order(po_id: UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(PurchaseOrder).where(PurchaseOrder.id == po_id))
-    po = result.scalar_one_or_none()
-    if not po:
-        raise HTTPException(404, "Purchase order not found")
+    po = await _get_po(db, po_id)
     if po.status not in ("draft", "cancelled"):
         raise HTTPException(400, "Can only delete draft or cancelled POs")
     await db.delete(po)
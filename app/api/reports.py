@@ -1,18 +1,45 @@
 """Reports & Analytics API — profit reports, sales trends, inventory health."""
 
+import asyncio
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func, select, extract
+from sqlalchemy import case, event, func, select, extract
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.cache import ResponseCache
 from app.database import get_db
 from app.models import Order, OrderItem, Product, InventoryItem, Supplier
 from app.services.profit_calc import ProfitCalculator, CostBreakdown
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+REPORT_TTL_SECONDS = 60
+LIVE_REPORT_TTL_SECONDS = 30  # overview and inventory health
+PROFIT_STREAM_BATCH = 500  # rows fetched and computed per streamed chunk
+
+# Handlers build plain dicts and return encoded Responses: the data is
+# server-produced, so neither model construction nor response_model
+# validation runs. The *Out models below only document the shapes.
+#
+# Reports are cached per path + query. Any committed write may change a
+# report, so every commit drops the whole cache; handlers read the cache
+# generation before querying so a result that raced a commit is not stored.
+# The TTL bounds staleness from writes made by other processes.
+_cache = ResponseCache()
+event.listen(Session, "after_commit", lambda session: _cache.clear())
+
+
+def reset_report_cache() -> None:
+    """Drop cached reports so the next request hits the database."""
+    _cache.clear()
+
 
 class ProfitReportOut(BaseModel):
     sku: str
@@ -56,48 +83,81 @@ class OverviewReport(BaseModel):
     platform_breakdown: list[dict]
 
 
+# Plain column tuples: no ORM identity map or instrumentation per row.
+_PROFIT_STMT = (
+    select(Product.sku, Product.title, Product.cost_price, Product.retail_price)
+    .where(Product.active.is_(True), Product.retail_price > 0)
+    .order_by(Product.sku)
+)
+
+
+def _profit_rows(rows, costs: CostBreakdown) -> list[dict]:
+    # One pass over float lanes instead of a Decimal calculation per product;
+    # both the cached and the streamed report go through it.
+    prices = [float(row.retail_price) for row in rows]
+    totals, nets, margins, rois, profitable = ProfitCalculator.calculate_bulk(
+        prices, [float(row.cost_price or 0) for row in rows], costs,
+    )
+    return [
+        {
+            "sku": row.sku,
+            "title": row.title,
+            "selling_price": round(prices[i], 2),
+            "total_cost": totals[i],
+            "net_profit": nets[i],
+            "net_margin_pct": margins[i],
+            "roi_pct": rois[i],
+            "is_profitable": profitable[i],
+        }
+        for i, row in enumerate(rows)
+    ]
+
+
+async def _stream_profit(bind, costs: CostBreakdown) -> AsyncIterator[bytes]:
+    # Own session: the generator outlives the request-scoped one.
+    async with AsyncSession(bind) as session:
+        result = await session.stream(_PROFIT_STMT)
+        async for partition in result.partitions(PROFIT_STREAM_BATCH):
+            yield b"".join(orjson.dumps(r) + b"\n" for r in _profit_rows(partition, costs))
+
+
 @router.get("/profit", response_model=list[ProfitReportOut])
 async def profit_report(
+    request: Request,
     platform_fee_pct: float = Query(15.0, description="Platform commission %"),
     fx_rate: float = Query(7.25, description="CNY/USD exchange rate"),
+    stream: bool = Query(False, description="Stream rows as NDJSON from a server-side cursor"),
     db: AsyncSession = Depends(get_db),
 ):
     """Calculate profit for all active products."""
-    result = await db.execute(
-        select(Product).where(Product.active.is_(True)).order_by(Product.sku)
-    )
-    products = result.scalars().all()
-
-    reports = []
-    for p in products:
-        if not p.retail_price or p.retail_price <= 0:
-            continue
-        costs = CostBreakdown(
-            product_cost=p.cost_price or Decimal("0"),
-            platform_fee_pct=Decimal(str(platform_fee_pct)),
-            fx_rate=Decimal(str(fx_rate)),
-        )
-        report = ProfitCalculator.calculate(p.retail_price, costs)
-        reports.append(ProfitReportOut(
-            sku=p.sku,
-            title=p.title,
-            selling_price=float(report.selling_price),
-            total_cost=float(report.total_cost),
-            net_profit=float(report.net_profit),
-            net_margin_pct=float(report.net_margin_pct),
-            roi_pct=float(report.roi_pct),
-            is_profitable=report.is_profitable,
-        ))
+    costs = CostBreakdown(platform_fee_pct=Decimal(str(platform_fee_pct)), fx_rate=Decimal(str(fx_rate)))
+    if stream:
+        return StreamingResponse(_stream_profit(db.bind, costs), media_type="application/x-ndjson")
 
-    return reports
+    if (cached := _cache.lookup(request)) is not None:
+        return cached
+    generation = _cache.generation
+    rows = (await db.execute(_PROFIT_STMT)).all()
+    reports = _profit_rows(rows, costs)
+    return _cache.store(request, reports, ttl=REPORT_TTL_SECONDS, generation=generation)
 
 
 @router.get("/sales-trends", response_model=list[SalesTrend])
 async def sales_trends(
+    request: Request,
     months: int = Query(6, ge=1, le=24, description="Number of months to analyze"),
     db: AsyncSession = Depends(get_db),
 ):
     """Get monthly sales trends."""
+    if (cached := _cache.lookup(request)) is not None:
+        return cached
+    generation = _cache.generation
+    # Bound the scan to the requested months (served by the created_at index)
+    # so the most recent months are returned rather than the oldest.
+    now = datetime.now(timezone.utc)
+    year, month = divmod(now.year * 12 + now.month - 1 - (months - 1), 12)
+    since = datetime(year, month + 1, 1, tzinfo=timezone.utc)
+
     stmt = (
         select(
             extract("year", Order.created_at).label("year"),
@@ -105,9 +165,9 @@ async def sales_trends(
             func.count(Order.id).label("order_count"),
             func.coalesce(func.sum(Order.total), 0).label("revenue"),
         )
+        .where(Order.created_at >= since)
         .group_by("year", "month")
         .order_by("year", "month")
-        .limit(months)
     )
     result = await db.execute(stmt)
     rows = result.all()
@@ -116,137 +176,134 @@ async def sales_trends(
     for row in rows:
         count = int(row.order_count)
         rev = float(row.revenue)
-        trends.append(SalesTrend(
-            period=f"{int(row.year)}-{int(row.month):02d}",
-            order_count=count,
-            revenue=round(rev, 2),
-            avg_order_value=round(rev / count, 2) if count > 0 else 0.0,
-        ))
-    return trends
+        trends.append({
+            "period": f"{int(row.year)}-{int(row.month):02d}",
+            "order_count": count,
+            "revenue": round(rev, 2),
+            "avg_order_value": round(rev / count, 2) if count > 0 else 0.0,
+        })
+    return _cache.store(request, trends, ttl=REPORT_TTL_SECONDS, generation=generation)
+
+
+# Availability and status are classified in SQL; rows come back ready to serialise.
+_INVENTORY_HEALTH_STMT = (
+    select(
+        Product.sku,
+        Product.title,
+        InventoryItem.warehouse,
+        InventoryItem.quantity,
+        InventoryItem.reserved,
+        InventoryItem.available,
+        InventoryItem.low_stock_threshold.label("threshold"),
+        case(
+            (InventoryItem.available == 0, "out_of_stock"),
+            (InventoryItem.available <= InventoryItem.low_stock_threshold // 2, "critical"),
+            (InventoryItem.is_low_stock, "low"),
+            else_="ok",
+        ).label("status"),
+    )
+    .join(Product, InventoryItem.product_id == Product.id)
+    .order_by(InventoryItem.quantity.asc())
+)
 
 
 @router.get("/inventory-health", response_model=list[InventoryHealthItem])
-async def inventory_health(db: AsyncSession = Depends(get_db)):
+async def inventory_health(request: Request, db: AsyncSession = Depends(get_db)):
     """Check inventory health across all warehouses."""
-    stmt = (
-        select(InventoryItem, Product)
-        .join(Product, InventoryItem.product_id == Product.id)
-        .order_by(InventoryItem.quantity.asc())
+    if (cached := _cache.lookup(request)) is not None:
+        return cached
+    generation = _cache.generation
+    result = await db.execute(_INVENTORY_HEALTH_STMT)
+    health = [dict(row) for row in result.mappings()]
+    return _cache.store(request, health, ttl=LIVE_REPORT_TTL_SECONDS, generation=generation)
+
+
+# Every overview counter as a scalar subquery of one SELECT — one round-trip.
+_OVERVIEW_TOTALS_STMT = select(
+    select(func.coalesce(func.sum(Order.total), 0)).scalar_subquery().label("total_revenue"),
+    select(func.count(Order.id)).scalar_subquery().label("total_orders"),
+    select(func.count(Product.id)).scalar_subquery().label("total_products"),
+    select(func.count(Product.id)).where(Product.active.is_(True))
+    .scalar_subquery().label("active_products"),
+    select(func.count()).select_from(InventoryItem).where(
+        InventoryItem.is_low_stock, InventoryItem.available > 0,
+    ).scalar_subquery().label("low_stock"),
+    select(func.count()).select_from(InventoryItem).where(InventoryItem.available == 0)
+    .scalar_subquery().label("out_of_stock"),
+    select(func.count(Supplier.id)).scalar_subquery().label("total_suppliers"),
+)
+
+
+# Top products by revenue
+_TOP_PRODUCTS_STMT = (
+    select(
+        OrderItem.sku,
+        func.sum(OrderItem.quantity).label("total_qty"),
+        func.sum(OrderItem.total_price).label("total_revenue"),
     )
-    result = await db.execute(stmt)
-    items = result.all()
-
-    health = []
-    for inv, prod in items:
-        available = max(0, inv.quantity - inv.reserved)
-        if available == 0:
-            status = "out_of_stock"
-        elif available <= inv.low_stock_threshold // 2:
-            status = "critical"
-        elif available <= inv.low_stock_threshold:
-            status = "low"
-        else:
-            status = "ok"
-
-        health.append(InventoryHealthItem(
-            sku=prod.sku,
-            title=prod.title,
-            warehouse=inv.warehouse,
-            quantity=inv.quantity,
-            reserved=inv.reserved,
-            available=available,
-            threshold=inv.low_stock_threshold,
-            status=status,
-        ))
-    return health
+    .group_by(OrderItem.sku)
+    .order_by(func.sum(OrderItem.total_price).desc())
+    .limit(10)
+)
+
+_PLATFORM_BREAKDOWN_STMT = (
+    select(
+        Order.platform,
+        func.count(Order.id).label("orders"),
+        func.coalesce(func.sum(Order.total), 0).label("revenue"),
+    )
+    .group_by(Order.platform)
+    .order_by(func.sum(Order.total).desc())
+)
+
+
+async def _fetch_all(bind, stmt) -> list:
+    """Run a read-only statement on a short-lived session of its own."""
+    async with AsyncSession(bind) as session:
+        return (await session.execute(stmt)).all()
 
 
 @router.get("/overview", response_model=OverviewReport)
-async def overview_report(db: AsyncSession = Depends(get_db)):
+async def overview_report(request: Request, db: AsyncSession = Depends(get_db)):
     """Comprehensive business overview report."""
-    # Revenue & orders
-    total_rev = (
-        await db.execute(select(func.coalesce(func.sum(Order.total), 0)))
-    ).scalar() or 0
-    total_orders = (
-        await db.execute(select(func.count(Order.id)))
-    ).scalar() or 0
-
+    if (cached := _cache.lookup(request)) is not None:
+        return cached
+    generation = _cache.generation
+    # The three queries are independent: run them concurrently, the grouped
+    # ones on their own sessions, so latency is the slowest rather than the sum.
+    totals_result, top_rows, platform_rows = await asyncio.gather(
+        db.execute(_OVERVIEW_TOTALS_STMT),
+        _fetch_all(db.bind, _TOP_PRODUCTS_STMT),
+        _fetch_all(db.bind, _PLATFORM_BREAKDOWN_STMT),
+    )
+    totals = totals_result.one()
+    total_rev = totals.total_revenue or 0
+    total_orders = totals.total_orders or 0
     avg_order = float(total_rev) / total_orders if total_orders > 0 else 0.0
 
-    # Products
-    total_products = (await db.execute(select(func.count(Product.id)))).scalar() or 0
-    active_products = (
-        await db.execute(select(func.count(Product.id)).where(Product.active.is_(True)))
-    ).scalar() or 0
-
-    # Inventory
-    low_stock = (
-        await db.execute(
-            select(func.count(InventoryItem.id)).where(
-                (InventoryItem.quantity - InventoryItem.reserved) <= InventoryItem.low_stock_threshold,
-                (InventoryItem.quantity - InventoryItem.reserved) > 0,
-            )
-        )
-    ).scalar() or 0
-
-    out_of_stock = (
-        await db.execute(
-            select(func.count(InventoryItem.id)).where(
-                (InventoryItem.quantity - InventoryItem.reserved) <= 0
-            )
-        )
-    ).scalar() or 0
-
-    # Suppliers
-    total_suppliers = (await db.execute(select(func.count(Supplier.id)))).scalar() or 0
-
-    # Top products by order count
-    top_stmt = (
-        select(
-            OrderItem.sku,
-            func.sum(OrderItem.quantity).label("total_qty"),
-            func.sum(OrderItem.total_price).label("total_revenue"),
-        )
-        .group_by(OrderItem.sku)
-        .order_by(func.sum(OrderItem.total_price).desc())
-        .limit(10)
-    )
-    top_result = await db.execute(top_stmt)
     top_products = [
         {"sku": r.sku, "total_qty": int(r.total_qty), "revenue": float(r.total_revenue)}
-        for r in top_result.all()
+        for r in top_rows
     ]
-
-    # Platform breakdown
-    platform_stmt = (
-        select(
-            Order.platform,
-            func.count(Order.id).label("orders"),
-            func.coalesce(func.sum(Order.total), 0).label("revenue"),
-        )
-        .group_by(Order.platform)
-        .order_by(func.sum(Order.total).desc())
-    )
-    platform_result = await db.execute(platform_stmt)
     platform_breakdown = [
         {
             "platform": r.platform.value if hasattr(r.platform, "value") else str(r.platform),
             "orders": int(r.orders),
             "revenue": float(r.revenue),
         }
-        for r in platform_result.all()
+        for r in platform_rows
     ]
 
-    return OverviewReport(
-        total_revenue=round(float(total_rev), 2),
-        total_orders=total_orders,
-        avg_order_value=round(avg_order, 2),
-        total_products=total_products,
-        active_products=active_products,
-        low_stock_count=low_stock,
-        out_of_stock_count=out_of_stock,
-        total_suppliers=total_suppliers,
-        top_products=top_products,
-        platform_breakdown=platform_breakdown,
-    )
+    report = {
+        "total_revenue": round(float(total_rev), 2),
+        "total_orders": total_orders,
+        "avg_order_value": round(avg_order, 2),
+        "total_products": totals.total_products or 0,
+        "active_products": totals.active_products or 0,
+        "low_stock_count": totals.low_stock or 0,
+        "out_of_stock_count": totals.out_of_stock or 0,
+        "total_suppliers": totals.total_suppliers or 0,
+        "top_products": top_products,
+        "platform_breakdown": platform_breakdown,
+    }
+    return _cache.store(request, report, ttl=LIVE_REPORT_TTL_SECONDS, generation=generation)
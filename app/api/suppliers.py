@@ -8,10 +8,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import Supplier
+from app.responses import ORJSONResponse
 from app.schemas import SupplierCreate, SupplierOut
 
 router = APIRouter(prefix="/suppliers", tags=["suppliers"])
 
+# Only the SupplierOut columns, fetched as plain rows rather than ORM entities
+_LIST_COLUMNS = [Supplier.__table__.c[name] for name in SupplierOut.model_fields]
+
 
 @router.get("/", response_model=list[SupplierOut])
 async def list_suppliers(
@@ -19,9 +23,10 @@ async def list_suppliers(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Supplier).order_by(Supplier.created_at.desc()).offset(skip).limit(limit)
+    stmt = select(*_LIST_COLUMNS).order_by(Supplier.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    # Row mappings go straight to orjson: no identity map, no per-row model
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("/", response_model=SupplierOut, status_code=201)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from app.services.warehouse import (
@@ -91,19 +91,8 @@ async def list_warehouses(
     country: Optional[str] = None,
 ):
     mgr = get_manager()
-    warehouses = mgr.list_warehouses(active_only, warehouse_type, country)
-    return [
-        {
-            "code": w.code,
-            "name": w.name,
-            "warehouse_type": w.warehouse_type,
-            "country": w.country,
-            "city": w.city,
-            "is_active": w.is_active,
-            "capacity_units": w.capacity_units,
-        }
-        for w in warehouses
-    ]
+    body = mgr.list_warehouses_json(active_only, warehouse_type, country)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/warehouses/{code}")
@@ -0,0 +1,77 @@
+"""In-process response cache for read-mostly GET endpoints."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, BaseModel):
+        return o.model_dump(mode="json")
+    return str(o)
+
+
+class ResponseCache:
+    """TTL cache of encoded JSON bodies keyed by path + query string.
+
+    Entries carry a content ETag so clients can revalidate with
+    If-None-Match. Bounded LRU; ``clear()`` is the invalidation hook and
+    bumps ``generation``, so a result computed before a clear is not stored.
+    Bodies are sent as ``private``: shared proxies must not keep them.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        # key -> (body, etag, ttl, expires_at)
+        self._entries: OrderedDict[str, tuple[bytes, str, int, float]] = OrderedDict()
+        self.generation = 0
+
+    @staticmethod
+    def _key(request: Request) -> str:
+        return f"{request.url.path}?{request.url.query}"
+
+    @staticmethod
+    def _headers(etag: str, ttl: int) -> dict[str, str]:
+        return {"ETag": etag, "Cache-Control": f"private, max-age={ttl}"}
+
+    def lookup(self, request: Request) -> Response | None:
+        """Cached response for this request (304 when the ETag matches), else None."""
+        key = self._key(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        body, etag, ttl, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        headers = self._headers(etag, ttl)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def store(self, request: Request, content: Any, ttl: int, generation: int) -> Response:
+        """Encode ``content`` once, cache it for ``ttl`` seconds and return it.
+
+        ``generation`` is the value read before ``content`` was computed; if
+        the cache was cleared since, the response is returned but not cached.
+        """
+        body = orjson.dumps(content, default=_default)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        if generation != self.generation:
+            return Response(body, media_type="application/json", headers=self._headers(etag, ttl))
+        key = self._key(request)
+        self._entries[key] = (body, etag, ttl, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return Response(body, media_type="application/json", headers=self._headers(etag, ttl))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     admin_email: str = "admin@example.com"
     admin_password: str = "changeme123"
     jwt_expire_minutes: int = 1440
+    bcrypt_rounds: int = 12  # each +1 doubles hashing time
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
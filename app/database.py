@@ -1,12 +1,27 @@
 """Async database engine."""
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
 
 settings = get_settings()
-engine = create_async_engine(settings.database_url, echo=settings.debug, pool_size=10)
+
+# Reports reuse a small set of identical statements; with asyncpg, keep their
+# prepared forms per connection so repeats skip parse/plan (bind+execute only).
+_connect_args = {}
+if make_url(settings.database_url).get_driver_name() == "asyncpg":
+    _connect_args = {"statement_cache_size": 1024, "prepared_statement_cache_size": 1024}
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    connect_args=_connect_args,
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -11,6 +11,7 @@ from app.api import products, orders, dashboard, suppliers, inventory
 from app.api import purchase_orders, auth_routes, reports
 from app.api import warehouse, returns, customers, restock, inventory_sync
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.responses import ORJSONResponse
 
 
 @asynccontextmanager
@@ -31,9 +32,11 @@ app = FastAPI(
                 "products, orders, inventory, suppliers, shipping, reports, "
                 "warehouse management, returns/refunds, customer CRM & analytics",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Rate limiting
+# add_middleware wraps the existing stack, so the last one added runs first:
+# CORS answers preflight OPTIONS before the rate limiter sees them.
 app.add_middleware(RateLimitMiddleware, requests_per_minute=120, burst=20)
 
 app.add_middleware(
@@ -45,19 +48,12 @@ app.add_middleware(
 )
 
 # Register routers
-app.include_router(auth_routes.router, prefix="/api/v1")
-app.include_router(products.router, prefix="/api/v1")
-app.include_router(orders.router, prefix="/api/v1")
-app.include_router(inventory.router, prefix="/api/v1")
-app.include_router(suppliers.router, prefix="/api/v1")
-app.include_router(purchase_orders.router, prefix="/api/v1")
-app.include_router(dashboard.router, prefix="/api/v1")
-app.include_router(reports.router, prefix="/api/v1")
-app.include_router(warehouse.router, prefix="/api/v1")
-app.include_router(returns.router, prefix="/api/v1")
-app.include_router(customers.router, prefix="/api/v1")
-app.include_router(restock.router, prefix="/api/v1")
-app.include_router(inventory_sync.router, prefix="/api/v1")
+ROUTERS = (
+    auth_routes, products, orders, inventory, suppliers, purchase_orders, dashboard,
+    reports, warehouse, returns, customers, restock, inventory_sync,
+)
+for module in ROUTERS:
+    app.include_router(module.router, prefix="/api/v1")
 
 
 @app.get("/health")
@@ -1,7 +1,6 @@
 """In-memory rate limiter middleware."""
 
 import time
-from collections import defaultdict
 from typing import Optional
 
 from fastapi import Request, Response
@@ -19,38 +18,52 @@ class RateLimiter:
     ):
         self.rate = requests_per_minute / 60.0  # tokens per second
         self.burst = burst
-        self._buckets: dict[str, dict] = defaultdict(
-            lambda: {"tokens": burst, "last": time.monotonic()}
-        )
+        # Parallel dicts (key -> tokens, key -> last refill) rather than a
+        # dict per bucket: fewer lookups and no per-key inner dict.
+        self._tokens: dict[str, float] = {}
+        self._last: dict[str, float] = {}
 
-    def _refill(self, key: str) -> None:
-        bucket = self._buckets[key]
+    def _refill(self, key: str) -> float:
         now = time.monotonic()
-        elapsed = now - bucket["last"]
-        bucket["tokens"] = min(self.burst, bucket["tokens"] + elapsed * self.rate)
-        bucket["last"] = now
+        tokens = min(
+            self.burst,
+            self._tokens.get(key, self.burst) + (now - self._last.get(key, now)) * self.rate,
+        )
+        self._last[key] = now
+        self._tokens[key] = tokens
+        return tokens
+
+    def acquire(self, key: str) -> tuple[bool, int]:
+        """Take a token if available; returns (allowed, remaining) from one refill."""
+        tokens = self._refill(key)
+        if tokens >= 1:
+            tokens -= 1
+            self._tokens[key] = tokens
+            return True, int(tokens)
+        return False, int(tokens)
 
     def allow(self, key: str) -> bool:
         """Check if request is allowed."""
-        self._refill(key)
-        bucket = self._buckets[key]
-        if bucket["tokens"] >= 1:
-            bucket["tokens"] -= 1
-            return True
-        return False
+        return self.acquire(key)[0]
 
     def remaining(self, key: str) -> int:
         """Get remaining tokens for a key."""
-        self._refill(key)
-        return max(0, int(self._buckets[key]["tokens"]))
+        return int(self._refill(key))
 
     def reset(self, key: Optional[str] = None) -> None:
         """Reset rate limit for a key or all keys."""
         if key:
-            if key in self._buckets:
-                del self._buckets[key]
+            self._tokens.pop(key, None)
+            self._last.pop(key, None)
         else:
-            self._buckets.clear()
+            self._tokens.clear()
+            self._last.clear()
+
+
+# Health checks and API docs are never rate limited.
+SKIP_PATHS = frozenset({
+    "/health", "/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc", "/favicon.ico",
+})
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -76,13 +89,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return request.client.host if request.client else "unknown"
 
     async def dispatch(self, request: Request, call_next) -> Response:
-        # Skip health check
-        if request.url.path == "/health":
+        # scope["path"] avoids building a URL object just to read the path
+        path = request.scope["path"]
+        if path in SKIP_PATHS or path.startswith("/static/"):
             return await call_next(request)
 
         key = self.key_func(request)
-        if not self.limiter.allow(key):
-            remaining = self.limiter.remaining(key)
+        allowed, remaining = self.limiter.acquire(key)
+        if not allowed:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -93,5 +107,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
 
         response = await call_next(request)
-        response.headers["X-RateLimit-Remaining"] = str(self.limiter.remaining(key))
+        # Append the pre-encoded header directly; no MutableHeaders round-trip
+        response.raw_headers.append((b"x-ratelimit-remaining", b"%d" % remaining))
         return response
@@ -1,27 +1,97 @@
 """ERP data models."""
 
-import uuid
-from datetime import datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text, JSON,
+    DDL, Boolean, Column, Computed, DateTime, Enum, FetchedValue, ForeignKey, Index, Integer, Numeric, String,
+    SmallInteger, Text, JSON, TypeDecorator, event, func,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.utils.time import utcnow
+from app.utils.uuid7 import uuid7
+
+# JSONB on Postgres (parsed once on write, GIN-indexable); plain JSON elsewhere.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+# Lists of strings: native text[] on Postgres (no JSON decode on fetch, GIN
+# containment with @>); a JSON list elsewhere.
+TextArray = JSON().with_variant(ARRAY(Text), "postgresql")
+
+
+def c_string(length: int) -> String:
+    """String collated "C" on Postgres, for identifiers compared across tables.
+
+    Both sides of a join must share a collation for the index to be usable,
+    and "C" B-trees also serve LIKE 'prefix%' without text_pattern_ops.
+    """
+    return String(length).with_variant(String(length, collation="C"), "postgresql")
+
+
+class StatusCode(TypeDecorator):
+    """Status stored as a 2-byte SMALLINT code, read and written as its name.
+
+    Codes are positions in ``values``, so new states may only be appended.
+    Callers keep using the strings (``Order.status == "pending"`` binds 0),
+    while rows and the status indexes stay narrower than a 4-byte PG enum.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: tuple[str, ...]):
+        super().__init__()
+        self.values = values
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self.values.index(value)
+        except ValueError:
+            raise ValueError(f"Invalid status {value!r}; expected one of {', '.join(self.values)}") from None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.values[value]
+
+
+ORDER_STATUSES = ("pending", "processing", "shipped", "delivered", "cancelled", "refunded")
+PO_STATUSES = ("draft", "sent", "confirmed", "shipped", "received", "cancelled")
+
+# updated_at is stamped by one BEFORE UPDATE trigger per table on Postgres
+# (columns declare server_onupdate=FetchedValue(), so the ORM re-reads it)
+# instead of a Python onupdate callback per row.
+_TOUCH_UPDATED_AT_FN = DDL(
+    """
+    CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """
+)
 
 
-def utcnow():
-    return datetime.now(timezone.utc)
+@event.listens_for(Base.metadata, "after_create")
+def _create_touch_triggers(target, connection, tables=(), **kw) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(_TOUCH_UPDATED_AT_FN)
+    for table in tables:
+        if "updated_at" in table.c:
+            connection.execute(DDL(
+                f"CREATE OR REPLACE TRIGGER trg_touch_{table.name} BEFORE UPDATE ON {table.name}"
+                " FOR EACH ROW EXECUTE FUNCTION touch_updated_at()"
+            ))
 
 
 class Product(Base):
     """Central product catalog."""
     __tablename__ = "products"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     sku = Column(String(100), unique=True, nullable=False, index=True)
     title = Column(String(500), nullable=False)
     description = Column(Text, default="")
@@ -32,19 +102,52 @@ class Product(Base):
     retail_price = Column(Numeric(10, 2), default=0)
     image_url = Column(String(1000), default="")
     active = Column(Boolean, default=True)
-    custom_fields = Column(JSON, default=dict)
+    custom_fields = Column(JSONType, default=dict)
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
 
-    platform_listings = relationship("PlatformListing", back_populates="product")
-    inventory_items = relationship("InventoryItem", back_populates="product")
+    __table_args__ = (
+        Index("ix_products_active_created", active, created_at.desc()),
+    )
+
+    # Collections never lazy-load: queries that need them must eager-load
+    # (selectinload), so an N+1 shows up as an error instead of a slow page.
+    # passive_deletes leaves child rows to the database's FK on delete.
+    platform_listings = relationship(
+        "PlatformListing", back_populates="product", lazy="raise_on_sql", passive_deletes=True,
+    )
+    inventory_items = relationship(
+        "InventoryItem", back_populates="product", lazy="raise_on_sql", passive_deletes=True,
+    )
+
+
+# Trigram GIN indexes let Postgres answer the catalogue's ILIKE '%q%' search
+# from the index instead of scanning every row. Postgres-only.
+event.listen(
+    Product.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for _col in ("title", "sku"):
+    event.listen(
+        Product.__table__, "after_create",
+        DDL(
+            f"CREATE INDEX IF NOT EXISTS ix_products_{_col}_trgm"
+            f" ON products USING gin ({_col} gin_trgm_ops)"
+        ).execute_if(dialect="postgresql"),
+    )
+event.listen(
+    Product.__table__, "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_products_custom_fields_gin ON products USING gin (custom_fields)"
+    ).execute_if(dialect="postgresql"),
+)
 
 
 class PlatformListing(Base):
     """Product listing on a specific platform."""
     __tablename__ = "platform_listings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=False)
     platform = Column(
         Enum("amazon", "shopify", "ebay", "aliexpress", "tiktok", "walmart", name="platform_type"),
@@ -65,43 +168,59 @@ class InventoryItem(Base):
     """Inventory tracking per product per warehouse."""
     __tablename__ = "inventory_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=False)
     warehouse = Column(String(100), default="default")
     quantity = Column(Integer, default=0)
     reserved = Column(Integer, default=0)
     low_stock_threshold = Column(Integer, default=10)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    # Stored generated columns: computed by the database on every write, so
+    # filters and reports read them like any other column.
+    available = Column(
+        Integer, Computed("CASE WHEN quantity > reserved THEN quantity - reserved ELSE 0 END", persisted=True),
+    )
+    is_low_stock = Column(Boolean, Computed("quantity - reserved <= low_stock_threshold", persisted=True))
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    # The partial indexes cover only the low-stock / out-of-stock rows, so the
+    # list filter and the overview counts read matches instead of the table.
+    __table_args__ = (
+        Index("ix_inventory_items_warehouse_product", warehouse, product_id),
+        Index(
+            "ix_inventory_items_low_stock", warehouse,
+            postgresql_where=is_low_stock, sqlite_where=is_low_stock,
+        ),
+        Index(
+            "ix_inventory_items_low_available", available,
+            postgresql_where=is_low_stock, sqlite_where=is_low_stock,
+        ),
+        Index(
+            "ix_inventory_items_out_of_stock", warehouse,
+            postgresql_where=available == 0, sqlite_where=available == 0,
+        ),
+    )
 
     product = relationship("Product", back_populates="inventory_items")
 
-    @property
-    def available(self) -> int:
-        return max(0, self.quantity - self.reserved)
-
-    @property
-    def is_low_stock(self) -> bool:
-        return self.available <= self.low_stock_threshold
-
 
 class Order(Base):
     """Unified order from any platform."""
     __tablename__ = "orders"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    order_number = Column(String(100), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    order_number = Column(c_string(100), unique=True, nullable=False, index=True)
     platform = Column(
         Enum("amazon", "shopify", "ebay", "aliexpress", "tiktok", "walmart", "manual", name="order_platform"),
         nullable=False,
     )
     platform_order_id = Column(String(200), default="")
     status = Column(
-        Enum("pending", "processing", "shipped", "delivered", "cancelled", "refunded", name="order_status"),
+        StatusCode(ORDER_STATUSES),
         default="pending",
     )
     customer_name = Column(String(300), default="")
-    customer_email = Column(String(320), default="")
-    shipping_address = Column(JSON, default=dict)
+    customer_email = Column(c_string(320), default="")
+    shipping_address = Column(JSONType, default=dict)
     subtotal = Column(Numeric(10, 2), default=0)
     shipping_cost = Column(Numeric(10, 2), default=0)
     tax = Column(Numeric(10, 2), default=0)
@@ -113,15 +232,22 @@ class Order(Base):
     ordered_at = Column(DateTime(timezone=True), nullable=True)
     shipped_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_orders_status_created", status, created_at.desc()),
+        Index("ix_orders_platform_created", platform, created_at.desc()),
+        Index("ix_orders_platform_status", platform, status),
+        Index("ix_orders_created", created_at.desc()),
+    )
 
-    items = relationship("OrderItem", back_populates="order")
+    items = relationship("OrderItem", back_populates="order", lazy="raise_on_sql")
 
 
 class OrderItem(Base):
     __tablename__ = "order_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=True)
     sku = Column(String(100), default="")
@@ -137,7 +263,7 @@ class Supplier(Base):
     """Supplier (1688, Alibaba, etc.)."""
     __tablename__ = "suppliers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(300), nullable=False)
     platform = Column(String(100), default="")  # 1688, alibaba, direct
     contact_name = Column(String(200), default="")
@@ -154,18 +280,46 @@ class PurchaseOrder(Base):
     """Purchase order to supplier."""
     __tablename__ = "purchase_orders"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     po_number = Column(String(100), unique=True, nullable=False)
     supplier_id = Column(UUID(as_uuid=True), ForeignKey("suppliers.id"), nullable=False)
     status = Column(
-        Enum("draft", "sent", "confirmed", "shipped", "received", "cancelled", name="po_status"),
+        StatusCode(PO_STATUSES),
         default="draft",
     )
-    items = Column(JSON, default=list)  # [{sku, quantity, unit_cost}]
     total_cost = Column(Numeric(10, 2), default=0)
     currency = Column(String(3), default="CNY")
     expected_date = Column(DateTime(timezone=True), nullable=True)
     received_date = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, default="")
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_purchase_orders_status_created", status, created_at.desc()),
+        # text_pattern_ops serves LIKE 'prefix%' lookups, which the collation-aware
+        # unique index cannot. Postgres-only: elsewhere it would duplicate the unique index.
+        Index(
+            "ix_purchase_orders_po_number_pattern", po_number,
+            postgresql_ops={"po_number": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    items = relationship(
+        "PurchaseOrderItem", back_populates="purchase_order", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="PurchaseOrderItem.id",  # uuid7: insertion order
+    )
+
+
+class PurchaseOrderItem(Base):
+    __tablename__ = "purchase_order_items"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    purchase_order_id = Column(
+        UUID(as_uuid=True), ForeignKey("purchase_orders.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
+    sku = Column(String(100), nullable=False, index=True)
+    quantity = Column(Integer, default=1)
+    unit_cost = Column(Numeric(10, 2), default=0)
+
+    purchase_order = relationship("PurchaseOrder", back_populates="items")
@@ -1,27 +1,26 @@
 """Customer management models."""
 
-import uuid
-from datetime import datetime, timezone
-
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text, JSON,
+    DDL, Boolean, Column, DateTime, Enum, FetchedValue, ForeignKey, Index, Integer, Numeric, String,
+    Text, event, func,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
-
-
-def utcnow():
-    return datetime.now(timezone.utc)
+from app.models import JSONType, TextArray, c_string
+from app.models import Order  # noqa: F401 — tables the stats triggers attach to
+from app.models.returns import ReturnRequest  # noqa: F401
+from app.utils.time import utcnow
+from app.utils.uuid7 import uuid7
 
 
 class Customer(Base):
     """Unified customer record across all platforms."""
     __tablename__ = "customers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(320), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    email = Column(c_string(320), unique=True, nullable=False, index=True)
     name = Column(String(300), default="")
     phone = Column(String(50), default="")
     country = Column(String(2), default="")
@@ -31,27 +30,27 @@ class Customer(Base):
         Enum("regular", "vip", "wholesale", "blacklisted", name="customer_tier"),
         default="regular",
     )
-    tags = Column(JSON, default=list)  # ["repeat_buyer", "high_value"]
+    tags = Column(TextArray, default=list)  # ["repeat_buyer", "high_value"]
     total_orders = Column(Integer, default=0)
     total_spent = Column(Numeric(12, 2), default=0)
     total_returns = Column(Integer, default=0)
     avg_order_value = Column(Numeric(10, 2), default=0)
     first_order_at = Column(DateTime(timezone=True), nullable=True)
     last_order_at = Column(DateTime(timezone=True), nullable=True)
-    platform_ids = Column(JSON, default=dict)  # {"amazon": "...", "shopify": "..."}
+    platform_ids = Column(JSONType, default=dict)  # {"amazon": "...", "shopify": "..."}
     notes = Column(Text, default="")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
 
-    interactions = relationship("CustomerInteraction", back_populates="customer")
+    interactions = relationship("CustomerInteraction", back_populates="customer", lazy="raise_on_sql")
 
 
 class CustomerInteraction(Base):
     """Customer interaction / support ticket log."""
     __tablename__ = "customer_interactions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
     interaction_type = Column(
         Enum("inquiry", "complaint", "review", "return", "feedback", "support", name="interaction_type"),
@@ -71,6 +70,78 @@ class CustomerInteraction(Base):
     assigned_to = Column(String(200), default="")
     reference = Column(String(200), default="")  # order_number, return_number, etc.
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_customer_interactions_customer_created", customer_id, created_at),
+    )
 
     customer = relationship("Customer", back_populates="interactions")
+
+
+# Customer order/return counters are kept current by Postgres triggers on
+# orders and return_requests (matched on email), so profile reads never
+# aggregate a customer's orders. Postgres-only; one statement per DDL for asyncpg.
+_STATS_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION update_customer_order_stats() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE customers SET
+                total_orders = total_orders + 1,
+                total_spent = total_spent + COALESCE(NEW.total, 0),
+                avg_order_value = ROUND((total_spent + COALESCE(NEW.total, 0)) / (total_orders + 1), 2),
+                first_order_at = LEAST(first_order_at, COALESCE(NEW.ordered_at, NEW.created_at)),
+                last_order_at = GREATEST(last_order_at, COALESCE(NEW.ordered_at, NEW.created_at))
+            WHERE email = NEW.customer_email;
+        ELSIF NEW.total IS DISTINCT FROM OLD.total THEN
+            UPDATE customers SET
+                total_spent = total_spent + COALESCE(NEW.total, 0) - COALESCE(OLD.total, 0),
+                avg_order_value = ROUND(
+                    (total_spent + COALESCE(NEW.total, 0) - COALESCE(OLD.total, 0)) / NULLIF(total_orders, 0), 2
+                )
+            WHERE email = NEW.customer_email;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER trg_orders_customer_stats
+    AFTER INSERT OR UPDATE OF total ON orders
+    FOR EACH ROW EXECUTE FUNCTION update_customer_order_stats()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION update_customer_return_stats() RETURNS trigger AS $$
+    BEGIN
+        UPDATE customers SET total_returns = total_returns + 1 WHERE email = NEW.customer_email;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER trg_returns_customer_stats
+    AFTER INSERT ON return_requests
+    FOR EACH ROW EXECUTE FUNCTION update_customer_return_stats()
+    """,
+)
+# Append-only interaction log: BRIN on created_at for time-range scans.
+event.listen(
+    CustomerInteraction.__table__, "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_customer_interactions_created_at_brin ON customer_interactions"
+        " USING brin (created_at) WITH (pages_per_range = 32)"
+    ).execute_if(dialect="postgresql"),
+)
+
+# Containment lookups (tags @> ARRAY['vip'], platform_ids ? 'amazon') via GIN.
+for _col in ("tags", "platform_ids"):
+    event.listen(
+        Customer.__table__, "after_create",
+        DDL(
+            f"CREATE INDEX IF NOT EXISTS ix_customers_{_col}_gin ON customers USING gin ({_col})"
+        ).execute_if(dialect="postgresql"),
+    )
+
+for _stmt in _STATS_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
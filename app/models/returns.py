@@ -1,34 +1,30 @@
 """Returns & refunds models."""
 
-import uuid
-from datetime import datetime, timezone
-
 from sqlalchemy import (
-    Column, DateTime, Enum, Numeric, String, Text, JSON,
+    DDL, Column, DateTime, Enum, FetchedValue, ForeignKey, Index, Integer, Numeric, String, Text, event, func,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 
 from app.database import Base
-
-
-def utcnow():
-    return datetime.now(timezone.utc)
+from app.models import StatusCode, TextArray, c_string
+from app.utils.time import utcnow
+from app.utils.uuid7 import uuid7
 
 
 class ReturnRequest(Base):
     """Customer return / refund request."""
     __tablename__ = "return_requests"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     return_number = Column(String(100), unique=True, nullable=False, index=True)
-    order_number = Column(String(100), nullable=False, index=True)
+    order_number = Column(c_string(100), ForeignKey("orders.order_number"), nullable=False, index=True)
     platform = Column(String(50), default="")
     status = Column(
-        Enum(
+        StatusCode((
             "requested", "approved", "rejected",
             "item_received", "refunded", "closed",
-            name="return_status",
-        ),
+        )),
         default="requested",
     )
     return_type = Column(
@@ -44,8 +40,7 @@ class ReturnRequest(Base):
         nullable=False,
     )
     customer_name = Column(String(300), default="")
-    customer_email = Column(String(320), default="")
-    items = Column(JSON, default=list)  # [{sku, quantity, unit_price}]
+    customer_email = Column(c_string(320), default="")
     refund_amount = Column(Numeric(10, 2), default=0)
     currency = Column(String(3), default="USD")
     restocking_fee = Column(Numeric(10, 2), default=0)
@@ -54,16 +49,55 @@ class ReturnRequest(Base):
     return_carrier = Column(String(100), default="")
     warehouse_code = Column(String(50), default="")
     quality_check = Column(
-        Enum("pending", "passed", "failed", "partial", name="qc_status"),
+        StatusCode(("pending", "passed", "failed", "partial")),
         default="pending",
     )
     customer_notes = Column(Text, default="")
     internal_notes = Column(Text, default="")
-    images = Column(JSON, default=list)  # URLs of return item photos
+    images = Column(TextArray, default=list)  # URLs of return item photos
     requested_at = Column(DateTime(timezone=True), default=utcnow)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     received_at = Column(DateTime(timezone=True), nullable=True)
     refunded_at = Column(DateTime(timezone=True), nullable=True)
     closed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_return_requests_status_requested", status, requested_at),
+        Index(
+            "ix_return_requests_return_number_pattern", return_number,
+            postgresql_ops={"return_number": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    items = relationship(
+        "ReturnItem", back_populates="return_request", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="ReturnItem.id",  # uuid7: insertion order
+    )
+
+
+class ReturnItem(Base):
+    """Line item of a return request."""
+    __tablename__ = "return_items"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    return_request_id = Column(
+        UUID(as_uuid=True), ForeignKey("return_requests.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
+    sku = Column(String(100), nullable=False, index=True)
+    quantity = Column(Integer, default=1)
+    unit_price = Column(Numeric(10, 2), default=0)
+
+    return_request = relationship("ReturnRequest", back_populates="items")
+
+
+# Append-only time series: a BRIN index on the insert timestamp stays tiny and
+# lets time-range scans skip whole block ranges. Postgres-only.
+event.listen(
+    ReturnRequest.__table__, "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_return_requests_requested_at_brin ON return_requests"
+        " USING brin (requested_at) WITH (pages_per_range = 32)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -1,26 +1,22 @@
 """Warehouse management models."""
 
-import uuid
-from datetime import datetime, timezone
-
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, JSON,
+    DDL, Boolean, Column, DateTime, Enum, FetchedValue, ForeignKey, Index, Integer, String, Text, event, func,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
-
-
-def utcnow():
-    return datetime.now(timezone.utc)
+from app.models import JSONType, StatusCode
+from app.utils.time import utcnow
+from app.utils.uuid7 import uuid7
 
 
 class Warehouse(Base):
     """Physical warehouse / fulfillment center."""
     __tablename__ = "warehouses"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     code = Column(String(50), unique=True, nullable=False, index=True)
     name = Column(String(300), nullable=False)
     warehouse_type = Column(
@@ -34,19 +30,29 @@ class Warehouse(Base):
     contact_phone = Column(String(50), default="")
     capacity_units = Column(Integer, default=0)  # max storage units
     is_active = Column(Boolean, default=True)
-    meta = Column(JSON, default=dict)
+    meta = Column(JSONType, default=dict)
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_warehouses_code_pattern", code, postgresql_ops={"code": "text_pattern_ops"}).ddl_if(
+            dialect="postgresql",
+        ),
+    )
 
+    # Unbounded history: never lazy-load per warehouse; queries that need the
+    # transfers selectinload them (one IN query per side for the whole page).
     transfers_out = relationship(
         "StockTransfer",
         back_populates="source_warehouse",
         foreign_keys="StockTransfer.source_warehouse_id",
+        lazy="raise_on_sql",
     )
     transfers_in = relationship(
         "StockTransfer",
         back_populates="dest_warehouse",
         foreign_keys="StockTransfer.dest_warehouse_id",
+        lazy="raise_on_sql",
     )
 
 
@@ -54,15 +60,14 @@ class StockTransfer(Base):
     """Stock transfer between warehouses."""
     __tablename__ = "stock_transfers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     transfer_number = Column(String(100), unique=True, nullable=False, index=True)
     source_warehouse_id = Column(UUID(as_uuid=True), ForeignKey("warehouses.id"), nullable=False)
     dest_warehouse_id = Column(UUID(as_uuid=True), ForeignKey("warehouses.id"), nullable=False)
     status = Column(
-        Enum("draft", "approved", "in_transit", "received", "cancelled", name="transfer_status"),
+        StatusCode(("draft", "approved", "in_transit", "received", "cancelled")),
         default="draft",
     )
-    items = Column(JSON, default=list)  # [{sku, quantity, product_id}]
     total_units = Column(Integer, default=0)
     shipping_carrier = Column(String(100), default="")
     tracking_number = Column(String(200), default="")
@@ -70,7 +75,14 @@ class StockTransfer(Base):
     received_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, default="")
     created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index(
+            "ix_stock_transfers_transfer_number_pattern", transfer_number,
+            postgresql_ops={"transfer_number": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     source_warehouse = relationship(
         "Warehouse", back_populates="transfers_out",
@@ -80,13 +92,32 @@ class StockTransfer(Base):
         "Warehouse", back_populates="transfers_in",
         foreign_keys=[dest_warehouse_id],
     )
+    items = relationship(
+        "StockTransferItem", back_populates="transfer", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="StockTransferItem.id",  # uuid7: insertion order
+    )
+
+
+class StockTransferItem(Base):
+    """Line item of a stock transfer."""
+    __tablename__ = "stock_transfer_items"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    transfer_id = Column(
+        UUID(as_uuid=True), ForeignKey("stock_transfers.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=True)
+    sku = Column(String(100), nullable=False, index=True)
+    quantity = Column(Integer, nullable=False)
+
+    transfer = relationship("StockTransfer", back_populates="items")
 
 
 class StockAdjustment(Base):
     """Manual stock adjustments (damage, returns, audits)."""
     __tablename__ = "stock_adjustments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     warehouse_code = Column(String(50), nullable=False)
     sku = Column(String(100), nullable=False)
     adjustment_type = Column(
@@ -98,3 +129,18 @@ class StockAdjustment(Base):
     reference = Column(String(200), default="")  # e.g. order number
     created_by = Column(String(200), default="system")
     created_at = Column(DateTime(timezone=True), default=utcnow)
+
+    __table_args__ = (
+        Index("ix_stock_adjustments_warehouse_sku", warehouse_code, sku),
+    )
+
+
+# Append-only time series: a BRIN index on the insert timestamp stays tiny and
+# lets time-range scans skip whole block ranges. Postgres-only.
+event.listen(
+    StockAdjustment.__table__, "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_stock_adjustments_created_at_brin ON stock_adjustments"
+        " USING brin (created_at) WITH (pages_per_range = 32)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,31 @@
+"""Shared response classes and helpers."""
+
+from typing import Any, Iterable
+
+import orjson
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson serializes dataclasses, UUIDs and datetimes natively (UTC as
+    ``Z``, matching Pydantic); Decimals fall through to ``str`` so money
+    values keep their exact precision.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+def adapter_response(adapter: TypeAdapter, rows: Iterable[Any]) -> Response:
+    """Validate ORM rows with a list ``TypeAdapter`` and send its JSON bytes.
+
+    Validation and encoding each run once over the whole list in
+    pydantic-core, rather than through a model and an encoder call per row.
+    """
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(adapter.dump_json(items), media_type="application/json")
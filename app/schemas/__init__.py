@@ -2,10 +2,27 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
+
+from app.models import ORDER_STATUSES, PO_STATUSES
+
+
+def _status_name(values: tuple[str, ...]):
+    """Accept a status by name or by its stored SMALLINT code."""
+    def coerce(value):
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if isinstance(value, int) and 0 <= value < len(values):
+            return values[value]
+        return value
+    return coerce
+
+
+OrderStatusName = Annotated[Literal[ORDER_STATUSES], BeforeValidator(_status_name(ORDER_STATUSES))]
+POStatusName = Annotated[Literal[PO_STATUSES], BeforeValidator(_status_name(PO_STATUSES))]
 
 
 # ── Product ──────────────────────────────────────────────
@@ -68,7 +85,7 @@ class OrderCreate(BaseModel):
 
 
 class OrderUpdate(BaseModel):
-    status: Optional[str] = None
+    status: Optional[OrderStatusName] = None
     tracking_number: Optional[str] = None
     shipping_carrier: Optional[str] = None
     notes: Optional[str] = None
@@ -139,3 +156,10 @@ class DashboardStats(BaseModel):
     total_revenue: Decimal
     low_stock_count: int
     total_suppliers: int
+
+
+# ── List adapters ────────────────────────────────────────
+# Validate and serialize a whole result list in one pydantic-core pass.
+PRODUCT_LIST = TypeAdapter(list[ProductOut])
+ORDER_LIST = TypeAdapter(list[OrderOut])
+INVENTORY_LIST = TypeAdapter(list[InventoryOut])
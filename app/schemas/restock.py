@@ -29,9 +29,8 @@ class RestockRecommendation(BaseModel):
     needs_restock: bool
     supplier_id: Optional[int] = None
     estimated_cost: float = Field(..., description="预估成本")
-    
-    class Config:
-        from_attributes = True
+
+    model_config = {"from_attributes": True}
 
 
 class RestockSummary(BaseModel):
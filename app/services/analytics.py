@@ -7,13 +7,22 @@ and simple revenue forecasting.
 
 from __future__ import annotations
 
-import statistics
+import heapq
+import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Sequence
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+import orjson
+
+
+_CENT = Decimal("0.01")
+# Orders that do not count toward sales, product or customer totals
+_EXCLUDED_STATUSES = frozenset({"cancelled", "refunded"})
 
 
 class Period(str, Enum):
@@ -48,7 +57,7 @@ class SalesMetric:
     def refund_rate(self) -> Decimal:
         if self.order_count == 0:
             return Decimal("0")
-        return (Decimal(self.refund_count) / Decimal(self.order_count) * 100).quantize(Decimal("0.01"))
+        return (Decimal(self.refund_count) / Decimal(self.order_count) * 100).quantize(_CENT)
 
 
 @dataclass
@@ -88,7 +97,7 @@ class CustomerValue:
         """Orders per 30 days."""
         if self.lifetime_days < 1:
             return Decimal(self.total_orders)
-        return (Decimal(self.total_orders) / Decimal(self.lifetime_days) * 30).quantize(Decimal("0.01"))
+        return (Decimal(self.total_orders) / Decimal(self.lifetime_days) * 30).quantize(_CENT)
 
 
 @dataclass
@@ -123,6 +132,57 @@ class AnalyticsReport:
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+def _mean_stdev(values: Sequence[float]) -> tuple[float, float]:
+    """Mean and sample standard deviation in plain float arithmetic.
+
+    ``statistics.mean``/``stdev`` convert every value to an exact fraction,
+    which is far slower than needed for a forecast rounded to cents.
+    Falls back to 10% of the mean when there are fewer than two values.
+    """
+    n = len(values)
+    mean = math.fsum(values) / n
+    if n < 2:
+        return mean, mean * 0.1
+    var = math.fsum((v - mean) ** 2 for v in values) / (n - 1)
+    return mean, math.sqrt(var)
+
+
+def _to_cents(value) -> int:
+    """Money value (str, int, float or Decimal) to integer cents.
+
+    Sums then run on ints instead of Decimals; sub-cent inputs round to the
+    nearest cent per value rather than after summing.
+    """
+    if isinstance(value, int):
+        return value * 100
+    return round(float(value) * 100)
+
+
+def _from_cents(cents: int) -> Decimal:
+    return (Decimal(cents) / 100).quantize(_CENT)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_date(text: str) -> Optional[date]:
+    """Date of an ISO-8601 string, or None; cached since exports repeat timestamps."""
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def _isoformat(value: date) -> str:
+    return value.isoformat()
+
+
+def _same(value):
+    return value
+
+
+# (order date, lower-cased status, raw order dict)
+_OrderRow = tuple[date, str, dict]
+
+
 class AnalyticsEngine:
     """Cross-border e-commerce analytics engine.
 
@@ -179,26 +239,26 @@ class AnalyticsEngine:
         end_date: Optional[date] = None,
     ) -> list[SalesMetric]:
         """Aggregate orders into time-period buckets."""
+        return self._aggregate(self._prepare(orders, start_date, end_date), period)
+
+    def _aggregate(self, rows: Sequence[_OrderRow], period: Period) -> list[SalesMetric]:
+        # Money accumulates as integer cents; Decimals are built per bucket at the end.
         buckets: dict[date, dict] = defaultdict(lambda: {
-            "orders": 0, "items": 0, "gross": Decimal("0"),
-            "net": Decimal("0"), "refunds": 0, "refund_amt": Decimal("0"),
+            "orders": 0, "items": 0, "gross": 0, "refunds": 0, "refund_amt": 0,
             "customers": set(),
         })
 
-        for o in orders:
-            odate = self._extract_date(o)
-            if odate is None:
-                continue
-            if start_date and odate < start_date:
-                continue
-            if end_date and odate > end_date:
-                continue
+        # Orders cluster on a few hundred distinct days: compute each day's
+        # bucket once instead of redoing the calendar math per order.
+        period_keys: dict[date, date] = {}
 
-            key = self._period_key(odate, period)
+        for odate, status, o in rows:
+            key = period_keys.get(odate)
+            if key is None:
+                key = period_keys[odate] = self._period_key(odate, period)
             b = buckets[key]
 
-            status = str(o.get("status", "")).lower()
-            total = Decimal(str(o.get("total", 0)))
+            total = _to_cents(o.get("total", 0))
 
             if status == "refunded":
                 b["refunds"] += 1
@@ -206,7 +266,6 @@ class AnalyticsEngine:
             else:
                 b["orders"] += 1
                 b["gross"] += total
-                b["net"] += total
                 items = o.get("items", [])
                 b["items"] += sum(int(i.get("quantity", 1)) for i in items) if items else 1
 
@@ -218,17 +277,18 @@ class AnalyticsEngine:
         for pstart in sorted(buckets):
             b = buckets[pstart]
             pend = self._period_end(pstart, period)
-            avg = (b["gross"] / b["orders"]).quantize(Decimal("0.01")) if b["orders"] else Decimal("0")
+            gross = _from_cents(b["gross"])
+            avg = (gross / b["orders"]).quantize(_CENT) if b["orders"] else Decimal("0")
             metrics.append(SalesMetric(
                 period_start=pstart,
                 period_end=pend,
                 order_count=b["orders"],
                 item_count=b["items"],
-                gross_revenue=b["gross"].quantize(Decimal("0.01")),
-                net_revenue=(b["net"] - b["refund_amt"]).quantize(Decimal("0.01")),
+                gross_revenue=gross,
+                net_revenue=_from_cents(b["gross"] - b["refund_amt"]),
                 avg_order_value=avg,
                 refund_count=b["refunds"],
-                refund_amount=b["refund_amt"].quantize(Decimal("0.01")),
+                refund_amount=_from_cents(b["refund_amt"]),
                 unique_customers=len(b["customers"]),
             ))
         return metrics
@@ -243,43 +303,43 @@ class AnalyticsEngine:
         end_date: Optional[date] = None,
     ) -> list[TopProduct]:
         """Rank products by revenue."""
+        return self._top_products(self._prepare(orders, start_date, end_date), limit)
+
+    def _top_products(self, rows: Sequence[_OrderRow], limit: int) -> list[TopProduct]:
+        # Scalars only: an order is counted once per SKU by remembering the
+        # last row that touched it, instead of keeping a set of order ids.
         products: dict[str, dict] = defaultdict(lambda: {
-            "title": "", "units": 0, "revenue": Decimal("0"), "orders": set(),
+            "title": "", "units": 0, "revenue": 0, "orders": 0, "last_row": -1,
         })
 
-        for o in orders:
-            odate = self._extract_date(o)
-            if odate is None:
-                continue
-            if start_date and odate < start_date:
-                continue
-            if end_date and odate > end_date:
-                continue
-            status = str(o.get("status", "")).lower()
-            if status in ("cancelled", "refunded"):
+        for row_idx, (_, status, o) in enumerate(rows):
+            if status in _EXCLUDED_STATUSES:
                 continue
 
-            oid = o.get("order_number", o.get("id", ""))
             for item in o.get("items", []):
                 sku = item.get("sku", "unknown")
                 p = products[sku]
                 p["title"] = item.get("title", "") or p["title"]
                 qty = int(item.get("quantity", 1))
-                price = Decimal(str(item.get("total_price", item.get("unit_price", 0))))
+                unit_price = _to_cents(item.get("unit_price", 0))
+                price = _to_cents(item["total_price"]) if "total_price" in item else unit_price
                 p["units"] += qty
-                p["revenue"] += price * qty if price == Decimal(str(item.get("unit_price", 0))) else price
-                p["orders"].add(oid)
+                p["revenue"] += price * qty if price == unit_price else price
+                if p["last_row"] != row_idx:
+                    p["last_row"] = row_idx
+                    p["orders"] += 1
 
-        ranked = sorted(products.items(), key=lambda x: x[1]["revenue"], reverse=True)
+        # Only the top `limit` are kept: O(K log limit) instead of sorting every SKU
+        ranked = heapq.nlargest(limit, products.items(), key=lambda x: x[1]["revenue"])
         return [
             TopProduct(
                 sku=sku,
                 title=data["title"],
                 units_sold=data["units"],
-                revenue=data["revenue"].quantize(Decimal("0.01")),
-                order_count=len(data["orders"]),
+                revenue=_from_cents(data["revenue"]),
+                order_count=data["orders"],
             )
-            for sku, data in ranked[:limit]
+            for sku, data in ranked
         ]
 
     # ── Platform Breakdown ──────────────────────────────
@@ -291,37 +351,35 @@ class AnalyticsEngine:
         end_date: Optional[date] = None,
     ) -> list[PlatformBreakdown]:
         """Revenue breakdown by platform."""
+        return self._platform_breakdown(self._prepare(orders, start_date, end_date))
+
+    def _platform_breakdown(self, rows: Sequence[_OrderRow]) -> list[PlatformBreakdown]:
         platforms: dict[str, dict] = defaultdict(lambda: {
-            "count": 0, "revenue": Decimal("0"),
+            "count": 0, "revenue": 0,
         })
-        total_revenue = Decimal("0")
+        total_revenue = 0
 
-        for o in orders:
-            odate = self._extract_date(o)
-            if odate is None:
-                continue
-            if start_date and odate < start_date:
-                continue
-            if end_date and odate > end_date:
-                continue
-            status = str(o.get("status", "")).lower()
-            if status in ("cancelled", "refunded"):
+        for _, status, o in rows:
+            if status in _EXCLUDED_STATUSES:
                 continue
 
             plat = str(o.get("platform", "unknown"))
-            total = Decimal(str(o.get("total", 0)))
+            total = _to_cents(o.get("total", 0))
             platforms[plat]["count"] += 1
             platforms[plat]["revenue"] += total
             total_revenue += total
 
         result = []
         for plat, data in sorted(platforms.items(), key=lambda x: x[1]["revenue"], reverse=True):
-            share = (data["revenue"] / total_revenue * 100).quantize(Decimal("0.01")) if total_revenue else Decimal("0")
-            avg = (data["revenue"] / data["count"]).quantize(Decimal("0.01")) if data["count"] else Decimal("0")
+            revenue = _from_cents(data["revenue"])
+            share = (
+                (Decimal(data["revenue"]) / total_revenue * 100).quantize(_CENT) if total_revenue else Decimal("0")
+            )
+            avg = (revenue / data["count"]).quantize(_CENT) if data["count"] else Decimal("0")
             result.append(PlatformBreakdown(
                 platform=plat,
                 order_count=data["count"],
-                revenue=data["revenue"].quantize(Decimal("0.01")),
+                revenue=revenue,
                 share_pct=share,
                 avg_order_value=avg,
             ))
@@ -336,16 +394,12 @@ class AnalyticsEngine:
     ) -> list[CustomerValue]:
         """Calculate customer lifetime value, ranked by total spend."""
         customers: dict[str, dict] = defaultdict(lambda: {
-            "name": "", "orders": 0, "spent": Decimal("0"),
+            "name": "", "orders": 0, "spent": 0,
             "first": date.max, "last": date.min,
         })
 
-        for o in orders:
-            odate = self._extract_date(o)
-            if odate is None:
-                continue
-            status = str(o.get("status", "")).lower()
-            if status in ("cancelled", "refunded"):
+        for odate, status, o in self._prepare(orders):
+            if status in _EXCLUDED_STATUSES:
                 continue
 
             cid = o.get("customer_email") or o.get("customer_name") or ""
@@ -354,21 +408,21 @@ class AnalyticsEngine:
             c = customers[cid]
             c["name"] = o.get("customer_name", "") or c["name"]
             c["orders"] += 1
-            c["spent"] += Decimal(str(o.get("total", 0)))
+            c["spent"] += _to_cents(o.get("total", 0))
             if odate < c["first"]:
                 c["first"] = odate
             if odate > c["last"]:
                 c["last"] = odate
 
-        ranked = sorted(customers.items(), key=lambda x: x[1]["spent"], reverse=True)
         result = []
-        for cid, c in ranked[:limit]:
-            avg = (c["spent"] / c["orders"]).quantize(Decimal("0.01")) if c["orders"] else Decimal("0")
+        for cid, c in heapq.nlargest(limit, customers.items(), key=lambda x: x[1]["spent"]):
+            spent = _from_cents(c["spent"])
+            avg = (spent / c["orders"]).quantize(_CENT) if c["orders"] else Decimal("0")
             result.append(CustomerValue(
                 customer_id=cid,
                 customer_name=c["name"],
                 total_orders=c["orders"],
-                total_spent=c["spent"].quantize(Decimal("0.01")),
+                total_spent=spent,
                 first_order=c["first"],
                 last_order=c["last"],
                 avg_order_value=avg,
@@ -431,25 +485,25 @@ class AnalyticsEngine:
 
         # Moving average
         w = min(window, len(values))
-        recent = values[-w:]
-        ma = statistics.mean(recent)
-        std = statistics.stdev(recent) if len(recent) >= 2 else ma * 0.1
+        ma, std = _mean_stdev(values[-w:])
 
-        forecasts = []
         last_date = metrics[-1].period_end
         period_delta = (metrics[-1].period_start - metrics[-2].period_start).days or 1
 
-        for i in range(1, periods_ahead + 1):
-            future_date = last_date + timedelta(days=period_delta * i)
-            predicted = Decimal(str(round(ma, 2)))
-            margin = Decimal(str(round(std * 1.96, 2)))  # 95% CI
-            forecasts.append(ForecastPoint(
-                period=future_date,
+        # The band is the same for every future period; only the date moves.
+        predicted = Decimal(str(round(ma, 2)))
+        margin = Decimal(str(round(std * 1.96, 2)))  # 95% CI
+        low = max(Decimal("0"), predicted - margin)
+        high = predicted + margin
+        return [
+            ForecastPoint(
+                period=last_date + timedelta(days=period_delta * i),
                 predicted_revenue=predicted,
-                confidence_low=max(Decimal("0"), predicted - margin),
-                confidence_high=predicted + margin,
-            ))
-        return forecasts
+                confidence_low=low,
+                confidence_high=high,
+            )
+            for i in range(1, periods_ahead + 1)
+        ]
 
     # ── Full Report ─────────────────────────────────────
 
@@ -463,9 +517,11 @@ class AnalyticsEngine:
         forecast_periods: int = 3,
     ) -> AnalyticsReport:
         """Generate a complete analytics report."""
-        metrics = self.aggregate(orders, period, start_date, end_date)
-        tops = self.top_products(orders, top_n, start_date, end_date)
-        platforms = self.platform_breakdown(orders, start_date, end_date)
+        # Parse and filter once; every section of the report shares the rows.
+        rows = self._prepare(orders, start_date, end_date)
+        metrics = self._aggregate(rows, period)
+        tops = self._top_products(rows, top_n)
+        platforms = self._platform_breakdown(rows)
 
         rev_trend = self.detect_trend(metrics, "gross_revenue") if metrics else None
         ord_trend = self.detect_trend(metrics, "order_count") if metrics else None
@@ -487,28 +543,45 @@ class AnalyticsEngine:
 
     def report_to_dict(self, report: AnalyticsReport) -> dict:
         """Convert report to JSON-serializable dict."""
+        return self._report_payload(report, str, _isoformat)
+
+    def report_to_json(self, report: AnalyticsReport) -> bytes:
+        """Report as JSON bytes, identical to ``report_to_dict`` once decoded.
+
+        Decimals and dates go to orjson as-is, skipping the per-field
+        ``str()``/``isoformat()`` strings the dict form builds first.
+        """
+        return orjson.dumps(self._report_payload(report, _same, _same), default=str)
+
+    def _report_payload(self, report: AnalyticsReport, money: Callable, when: Callable) -> dict:
+        """Report fields with Decimals passed through ``money`` and dates through ``when``."""
+        # Summary totals in one pass over the metrics
+        total_orders = total_refunds = 0
+        total_revenue = Decimal("0")
+        for m in report.metrics:
+            total_orders += m.order_count
+            total_refunds += m.refund_count
+            total_revenue += m.gross_revenue
+
         return {
             "period": report.period.value,
-            "start_date": report.start_date.isoformat(),
-            "end_date": report.end_date.isoformat(),
-            "generated_at": report.generated_at.isoformat(),
+            "start_date": when(report.start_date),
+            "end_date": when(report.end_date),
+            "generated_at": when(report.generated_at),
             "summary": {
-                "total_orders": sum(m.order_count for m in report.metrics),
-                "total_revenue": str(sum(m.gross_revenue for m in report.metrics)),
-                "total_refunds": sum(m.refund_count for m in report.metrics),
-                "avg_order_value": str(
-                    (sum(m.gross_revenue for m in report.metrics) /
-                     max(1, sum(m.order_count for m in report.metrics))).quantize(Decimal("0.01"))
-                ),
+                "total_orders": total_orders,
+                "total_revenue": money(total_revenue),
+                "total_refunds": total_refunds,
+                "avg_order_value": money((total_revenue / max(1, total_orders)).quantize(_CENT)),
             },
             "metrics": [
                 {
-                    "period_start": m.period_start.isoformat(),
-                    "period_end": m.period_end.isoformat(),
+                    "period_start": when(m.period_start),
+                    "period_end": when(m.period_end),
                     "order_count": m.order_count,
-                    "gross_revenue": str(m.gross_revenue),
-                    "net_revenue": str(m.net_revenue),
-                    "avg_order_value": str(m.avg_order_value),
+                    "gross_revenue": money(m.gross_revenue),
+                    "net_revenue": money(m.net_revenue),
+                    "avg_order_value": money(m.avg_order_value),
                     "refund_count": m.refund_count,
                     "unique_customers": m.unique_customers,
                 }
@@ -519,7 +592,7 @@ class AnalyticsEngine:
                     "sku": tp.sku,
                     "title": tp.title,
                     "units_sold": tp.units_sold,
-                    "revenue": str(tp.revenue),
+                    "revenue": money(tp.revenue),
                 }
                 for tp in report.top_products
             ],
@@ -527,21 +600,21 @@ class AnalyticsEngine:
                 {
                     "platform": pb.platform,
                     "order_count": pb.order_count,
-                    "revenue": str(pb.revenue),
-                    "share_pct": str(pb.share_pct),
+                    "revenue": money(pb.revenue),
+                    "share_pct": money(pb.share_pct),
                 }
                 for pb in report.platform_breakdown
             ],
             "revenue_trend": {
                 "direction": report.revenue_trend.direction.value,
-                "change_pct": str(report.revenue_trend.change_pct),
+                "change_pct": money(report.revenue_trend.change_pct),
             } if report.revenue_trend else None,
             "forecast": [
                 {
-                    "period": fp.period.isoformat(),
-                    "predicted": str(fp.predicted_revenue),
-                    "low": str(fp.confidence_low),
-                    "high": str(fp.confidence_high),
+                    "period": when(fp.period),
+                    "predicted": money(fp.predicted_revenue),
+                    "low": money(fp.confidence_low),
+                    "high": money(fp.confidence_high),
                 }
                 for fp in report.forecast
             ],
@@ -549,6 +622,25 @@ class AnalyticsEngine:
 
     # ── Helpers ─────────────────────────────────────────
 
+    def _prepare(
+        self,
+        orders: Sequence[dict],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> list[_OrderRow]:
+        """Extract each order's date and status once, dropping undated or out-of-range orders."""
+        rows = []
+        for o in orders:
+            odate = self._extract_date(o)
+            if odate is None:
+                continue
+            if start_date and odate < start_date:
+                continue
+            if end_date and odate > end_date:
+                continue
+            rows.append((odate, str(o.get("status", "")).lower(), o))
+        return rows
+
     @staticmethod
     def _extract_date(order: dict) -> Optional[date]:
         """Extract date from an order dict (supports multiple key names)."""
@@ -561,8 +653,7 @@ class AnalyticsEngine:
             if isinstance(val, date):
                 return val
             if isinstance(val, str):
-                try:
-                    return datetime.fromisoformat(val.replace("Z", "+00:00")).date()
-                except (ValueError, TypeError):
-                    continue
+                parsed = _parse_iso_date(val)
+                if parsed is not None:
+                    return parsed
         return None
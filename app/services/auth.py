@@ -1,6 +1,8 @@
 """JWT Authentication service."""
 
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
@@ -15,9 +17,13 @@ security = HTTPBearer(auto_error=False)
 
 ALGORITHM = "HS256"
 
+# Decoded claims are reused for this many seconds, so bursts from the same
+# session skip the base64 + HMAC work.
+TOKEN_CACHE_SECONDS = 5
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -26,21 +32,33 @@ def verify_password(plain: str, hashed: str) -> bool:
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
-    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
+    to_encode.update({"exp": expire, "iat": now})
     return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
 
 
+@lru_cache(maxsize=1024)
+def _decode_cached(token: str, bucket: int) -> dict:
+    # ``bucket`` is part of the key only, so entries roll over every
+    # TOKEN_CACHE_SECONDS. Failures raise and are never cached.
+    return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+
+
 def decode_token(token: str) -> dict:
+    now = time.time()
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        return payload
+        payload = _decode_cached(token, int(now // TOKEN_CACHE_SECONDS))
     except JWTError:
+        payload = None
+    # A cached entry may outlive the token by up to one bucket; re-check exp.
+    if payload is None or payload.get("exp", now + 1) <= now:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return dict(payload)
 
 
 async def get_current_user(
@@ -8,11 +8,11 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 from dataclasses import dataclass, field
-from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import orjson
 
 
 @dataclass
@@ -86,6 +86,15 @@ ORDER_FIELDS = {
 }
 
 
+# Truthy spellings for bool import fields; anything else is False
+_BOOL_TRUE = frozenset({"true", "1", "yes", "y", "on"})
+
+# Input types Decimal() converts exactly, without a str() round-trip
+_EXACT_DECIMAL_TYPES = (str, int, Decimal)
+
+FieldCheck = Callable[[Any, int], tuple[Any, Optional[ImportError]]]
+
+
 class BulkValidator:
     """Validate individual fields against field definitions."""
 
@@ -97,53 +106,85 @@ class BulkValidator:
         row: int,
     ) -> tuple[Any, Optional[ImportError]]:
         """Validate and coerce a single field value."""
-        ftype = spec.get("type", "str")
-        required = spec.get("required", False)
+        return BulkValidator.compile_field(name, spec)(value, row)
 
-        # Handle missing/empty
-        if value is None or (isinstance(value, str) and value.strip() == ""):
-            if required:
+    @staticmethod
+    def compile(field_defs: dict) -> list[tuple[str, FieldCheck]]:
+        """Compile every field of ``field_defs``, in order, for one import run."""
+        return [(name, BulkValidator.compile_field(name, spec)) for name, spec in field_defs.items()]
+
+    @staticmethod
+    def compile_field(name: str, spec: dict) -> FieldCheck:
+        """Build a ``(value, row) -> (value, error)`` checker for one field.
+
+        The spec is read once here, so per-cell calls only run the checks
+        themselves instead of re-reading the spec dict for every value.
+        """
+        ftype = spec.get("type", "str")
+        if spec.get("required", False):
+            def missing(row: int) -> tuple[Any, Optional[ImportError]]:
                 return None, ImportError(row, name, "", f"Required field '{name}' is empty")
-            return spec.get("default", "" if ftype == "str" else 0), None
+        else:
+            default = spec.get("default", "" if ftype == "str" else 0)
 
-        # Type coercion
-        try:
-            if ftype == "str":
+            def missing(row: int) -> tuple[Any, Optional[ImportError]]:
+                return default, None
+
+        if ftype == "str":
+            max_len = spec.get("max_length")
+            choices = spec.get("choices")
+            allowed = frozenset(c.lower() for c in choices) if choices else None
+
+            def coerce(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
                 val = str(value).strip()
-                max_len = spec.get("max_length")
                 if max_len and len(val) > max_len:
                     return None, ImportError(row, name, val[:50], f"Exceeds max length {max_len}")
-                choices = spec.get("choices")
-                if choices and val.lower() not in [c.lower() for c in choices]:
+                if allowed is not None and val.lower() not in allowed:
                     return None, ImportError(row, name, val, f"Must be one of: {choices}")
                 return val, None
 
-            elif ftype == "int":
+        elif ftype == "int":
+            mn, mx = spec.get("min"), spec.get("max")
+
+            def coerce(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
                 val = int(float(value))
-                mn, mx = spec.get("min"), spec.get("max")
                 if mn is not None and val < mn:
                     return None, ImportError(row, name, str(val), f"Below minimum {mn}")
                 if mx is not None and val > mx:
                     return None, ImportError(row, name, str(val), f"Above maximum {mx}")
                 return val, None
 
-            elif ftype == "decimal":
-                val = Decimal(str(value))
-                mn = spec.get("min")
-                if mn is not None and val < Decimal(str(mn)):
+        elif ftype == "decimal":
+            mn = spec.get("min")
+            min_val = Decimal(str(mn)) if mn is not None else None
+
+            def coerce(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
+                # CSV cells and JSON ints convert exactly as-is; floats (and
+                # bools etc.) still go through str() so 1.1 stays 1.1.
+                val = Decimal(value) if type(value) in _EXACT_DECIMAL_TYPES else Decimal(str(value))
+                if min_val is not None and val < min_val:
                     return None, ImportError(row, name, str(val), f"Below minimum {mn}")
                 return val, None
 
-            elif ftype == "bool":
+        elif ftype == "bool":
+            def coerce(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
                 if isinstance(value, bool):
                     return value, None
-                sv = str(value).strip().lower()
-                return sv in ("true", "1", "yes", "y", "on"), None
+                return str(value).strip().lower() in _BOOL_TRUE, None
+
+        else:
+            def coerce(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
+                return value, None
 
-        except (ValueError, InvalidOperation, TypeError) as e:
-            return None, ImportError(row, name, str(value)[:50], f"Invalid {ftype}: {e}")
+        def check(value: Any, row: int) -> tuple[Any, Optional[ImportError]]:
+            if value is None or (isinstance(value, str) and value.strip() == ""):
+                return missing(row)
+            try:
+                return coerce(value, row)
+            except (ValueError, InvalidOperation, TypeError) as e:
+                return None, ImportError(row, name, str(value)[:50], f"Invalid {ftype}: {e}")
 
-        return value, None
+        return check
 
 
 class BulkImporter:
@@ -156,32 +197,49 @@ class BulkImporter:
 
     def import_products_csv(self, content: str, skip_header: bool = True) -> ImportResult:
         """Import products from CSV string."""
-        return self._import_csv(content, PRODUCT_FIELDS, "sku", skip_header)
+        return self._import_csv(io.StringIO(content), PRODUCT_FIELDS, "sku", skip_header)
 
     def import_orders_csv(self, content: str, skip_header: bool = True) -> ImportResult:
         """Import orders from CSV string."""
-        return self._import_csv(content, ORDER_FIELDS, "platform_order_id", skip_header)
+        return self._import_csv(io.StringIO(content), ORDER_FIELDS, "platform_order_id", skip_header)
+
+    def import_products_csv_stream(self, stream: Iterable[str], skip_header: bool = True) -> ImportResult:
+        """Import products from a text stream, consuming it row by row."""
+        return self._import_csv(stream, PRODUCT_FIELDS, "sku", skip_header)
+
+    def import_orders_csv_stream(self, stream: Iterable[str], skip_header: bool = True) -> ImportResult:
+        """Import orders from a text stream, consuming it row by row."""
+        return self._import_csv(stream, ORDER_FIELDS, "platform_order_id", skip_header)
 
     def _import_csv(
         self,
-        content: str,
+        lines: Iterable[str],
         field_defs: dict,
         dedup_key: str,
         skip_header: bool,
     ) -> ImportResult:
         result = ImportResult()
-        reader = csv.DictReader(io.StringIO(content))
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return result
+
+        # Resolve each field's column once; rows stay plain lists instead of
+        # being zipped into a dict per row. Duplicate headers: last one wins.
+        positions = {name: i for i, name in enumerate(header)}
+        columns = [(fname, check, positions.get(fname)) for fname, check in self._validator.compile(field_defs)]
 
         seen_keys: set[str] = set()
 
-        for row_num, row in enumerate(reader, start=2 if skip_header else 1):
+        for row_num, row in enumerate(filter(None, reader), start=2 if skip_header else 1):
             result.total_rows += 1
             record: dict = {}
             row_errors = []
+            width = len(row)
 
-            for fname, spec in field_defs.items():
-                raw = row.get(fname)
-                val, err = self._validator.validate_field(fname, raw, spec, row_num)
+            for fname, check, idx in columns:
+                raw = row[idx] if idx is not None and idx < width else None
+                val, err = check(raw, row_num)
                 if err:
                     row_errors.append(err)
                 else:
@@ -208,24 +266,24 @@ class BulkImporter:
 
     # ── JSON Import ─────────────────────────────────────
 
-    def import_products_json(self, content: str) -> ImportResult:
-        """Import products from JSON string (array of objects)."""
+    def import_products_json(self, content: str | bytes) -> ImportResult:
+        """Import products from JSON text or raw bytes (array of objects)."""
         return self._import_json(content, PRODUCT_FIELDS, "sku")
 
-    def import_orders_json(self, content: str) -> ImportResult:
-        """Import orders from JSON string (array of objects)."""
+    def import_orders_json(self, content: str | bytes) -> ImportResult:
+        """Import orders from JSON text or raw bytes (array of objects)."""
         return self._import_json(content, ORDER_FIELDS, "platform_order_id")
 
     def _import_json(
         self,
-        content: str,
+        content: str | bytes,
         field_defs: dict,
         dedup_key: str,
     ) -> ImportResult:
         result = ImportResult()
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             result.errors.append(ImportError(0, "", "", f"Invalid JSON: {e}"))
             return result
 
@@ -233,6 +291,7 @@ class BulkImporter:
             result.errors.append(ImportError(0, "", "", "JSON root must be an array"))
             return result
 
+        checks = self._validator.compile(field_defs)
         seen_keys: set[str] = set()
 
         for row_num, item in enumerate(data, start=1):
@@ -245,9 +304,8 @@ class BulkImporter:
             record: dict = {}
             row_errors = []
 
-            for fname, spec in field_defs.items():
-                raw = item.get(fname)
-                val, err = self._validator.validate_field(fname, raw, spec, row_num)
+            for fname, check in checks:
+                val, err = check(item.get(fname), row_num)
                 if err:
                     row_errors.append(err)
                 else:
@@ -272,54 +330,82 @@ class BulkImporter:
         return result
 
 
+def _json_default(o: Any) -> Any:
+    if isinstance(o, Decimal):
+        return float(o)
+    return str(o)
+
+
+def _csv_cell(v: Any) -> Any:
+    return float(v) if isinstance(v, Decimal) else v
+
+
 class BulkExporter:
     """Export products and orders to CSV/JSON."""
 
+    @staticmethod
+    def iter_csv(rows: Iterable[dict], columns: list[str]) -> Iterator[str]:
+        """Yield CSV text one line at a time, header first.
+
+        A single StringIO buffer is reused and truncated after every row,
+        so memory stays flat regardless of the number of rows.
+        """
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(columns)
+        yield buf.getvalue()
+        for row in rows:
+            buf.seek(0)
+            buf.truncate(0)
+            # Pull only the exported columns, in order, straight into a list
+            writer.writerow([_csv_cell(row.get(c, "")) for c in columns])
+            yield buf.getvalue()
+
+    @staticmethod
+    def iter_products_csv(products: list[dict], columns: Optional[list[str]] = None) -> Iterator[str]:
+        """Stream products as CSV lines."""
+        if not products:
+            return iter(())
+        return BulkExporter.iter_csv(products, columns or list(PRODUCT_FIELDS.keys()))
+
+    @staticmethod
+    def iter_products_json(products: list[dict], pretty: bool = True) -> Iterator[bytes]:
+        """Stream products as a JSON array, one encoded object at a time.
+
+        The bytes match ``products_to_json`` for the same arguments.
+        """
+        if not products:
+            yield b"[]"
+            return
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        yield b"[\n  " if pretty else b"["
+        for i, p in enumerate(products):
+            if i:
+                yield b",\n  " if pretty else b","
+            body = orjson.dumps(p, default=_json_default, option=option)
+            # Nest the object one level inside the array; orjson escapes
+            # newlines within strings, so every raw newline is structural.
+            yield body.replace(b"\n", b"\n  ") if pretty else body
+        yield b"\n]" if pretty else b"]"
+
     @staticmethod
     def products_to_csv(products: list[dict], columns: Optional[list[str]] = None) -> str:
         """Export products to CSV."""
-        if not products:
-            return ""
-        cols = columns or list(PRODUCT_FIELDS.keys())
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=cols, extrasaction="ignore")
-        writer.writeheader()
-        for p in products:
-            clean = {}
-            for k, v in p.items():
-                if k in cols:
-                    clean[k] = float(v) if isinstance(v, Decimal) else v
-            writer.writerow(clean)
-        return buf.getvalue()
+        return "".join(BulkExporter.iter_products_csv(products, columns))
 
     @staticmethod
     def products_to_json(products: list[dict], pretty: bool = True) -> str:
         """Export products to JSON."""
-        def default(o):
-            if isinstance(o, Decimal):
-                return float(o)
-            if isinstance(o, datetime):
-                return o.isoformat()
-            return str(o)
-
-        return json.dumps(products, default=default, ensure_ascii=False, indent=2 if pretty else None)
+        # orjson writes datetimes as isoformat itself; _json_default covers the rest
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(products, default=_json_default, option=option).decode("utf-8")
 
     @staticmethod
     def orders_to_csv(orders: list[dict], columns: Optional[list[str]] = None) -> str:
         """Export orders to CSV."""
         if not orders:
             return ""
-        cols = columns or list(ORDER_FIELDS.keys())
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=cols, extrasaction="ignore")
-        writer.writeheader()
-        for o in orders:
-            clean = {}
-            for k, v in o.items():
-                if k in cols:
-                    clean[k] = float(v) if isinstance(v, Decimal) else v
-            writer.writerow(clean)
-        return buf.getvalue()
+        return "".join(BulkExporter.iter_csv(orders, columns or list(ORDER_FIELDS.keys())))
 
     @staticmethod
     def generate_template(entity: str = "products") -> str:
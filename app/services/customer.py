@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -44,7 +45,10 @@ class CustomerManager:
 
     def __init__(self):
         self._customers: dict[str, dict] = {}  # email -> customer
+        self._by_id: dict[str, dict] = {}  # id -> customer (ids never change)
         self._interactions: list[dict] = []
+        self._interactions_by_id: dict[str, dict] = {}
+        self._interactions_by_email: dict[str, list[dict]] = {}
 
     def create_customer(self, data: CustomerData) -> dict:
         """Create or update a customer."""
@@ -93,16 +97,14 @@ class CustomerManager:
             "updated_at": now,
         }
         self._customers[data.email] = customer
+        self._by_id[customer["id"]] = customer
         return customer
 
     def get_customer(self, email: str) -> Optional[dict]:
         return self._customers.get(email)
 
     def get_customer_by_id(self, customer_id: str) -> Optional[dict]:
-        for c in self._customers.values():
-            if c["id"] == customer_id:
-                return c
-        return None
+        return self._by_id.get(customer_id)
 
     def deactivate_customer(self, email: str) -> bool:
         c = self._customers.get(email)
@@ -131,10 +133,26 @@ class CustomerManager:
 
     def record_order(self, email: str, order_total: float) -> dict:
         """Record a new order for a customer (updates stats)."""
+        return self._apply_order(self._require(email), order_total, datetime.now(timezone.utc).isoformat())
+
+    def bulk_record_orders(self, items: list[tuple[str, float]]) -> list[dict]:
+        """Record many ``(email, order_total)`` orders stamped with one timestamp.
+
+        Every email is checked first, so an unknown customer leaves the whole
+        batch unapplied.
+        """
+        customers = [self._require(email) for email, _ in items]
+        now = datetime.now(timezone.utc).isoformat()
+        return [self._apply_order(c, total, now) for c, (_, total) in zip(customers, items)]
+
+    def _require(self, email: str) -> dict:
         c = self._customers.get(email)
         if not c:
             raise ValueError(f"Customer not found: {email}")
-        now = datetime.now(timezone.utc).isoformat()
+        return c
+
+    @staticmethod
+    def _apply_order(c: dict, order_total: float, now: str) -> dict:
         c["total_orders"] += 1
         c["total_spent"] = round(c["total_spent"] + order_total, 2)
         c["avg_order_value"] = round(c["total_spent"] / c["total_orders"], 2)
@@ -171,19 +189,18 @@ class CustomerManager:
         sort_by: str = "total_spent",
         limit: int = 100,
     ) -> list[dict]:
-        result = list(self._customers.values())
-        if active_only:
-            result = [c for c in result if c["is_active"]]
-        if tier:
-            result = [c for c in result if c["tier"] == tier]
-        if country:
-            result = [c for c in result if c["country"] == country]
-        if tag:
-            result = [c for c in result if tag in c["tags"]]
-        if min_orders > 0:
-            result = [c for c in result if c["total_orders"] >= min_orders]
+        # One pass with every filter applied per customer, instead of a new
+        # list per filter; then keep only the top `limit` when sorting.
+        result = [
+            c for c in self._customers.values()
+            if (not active_only or c["is_active"])
+            and (not tier or c["tier"] == tier)
+            and (not country or c["country"] == country)
+            and (not tag or tag in c["tags"])
+            and c["total_orders"] >= min_orders
+        ]
         if sort_by in ("total_spent", "total_orders", "avg_order_value"):
-            result.sort(key=lambda c: c.get(sort_by, 0), reverse=True)
+            return heapq.nlargest(limit, result, key=lambda c: c.get(sort_by, 0))
         return result[:limit]
 
     def search_customers(self, query: str) -> list[dict]:
@@ -196,6 +213,16 @@ class CustomerManager:
 
     def create_interaction(self, data: InteractionData) -> dict:
         """Log a customer interaction."""
+        c = self._check_interaction(data)
+        return self._add_interaction(data, c, datetime.now(timezone.utc).isoformat())
+
+    def bulk_create_interactions(self, items: list[InteractionData]) -> list[dict]:
+        """Log many interactions stamped with one timestamp; all are validated first."""
+        customers = [self._check_interaction(data) for data in items]
+        now = datetime.now(timezone.utc).isoformat()
+        return [self._add_interaction(data, c, now) for data, c in zip(items, customers)]
+
+    def _check_interaction(self, data: InteractionData) -> dict:
         if data.interaction_type not in self.VALID_INTERACTION_TYPES:
             raise ValueError(f"Invalid type: {data.interaction_type}")
         if data.sentiment not in self.VALID_SENTIMENTS:
@@ -203,7 +230,9 @@ class CustomerManager:
         c = self._customers.get(data.customer_email)
         if not c:
             raise ValueError(f"Customer not found: {data.customer_email}")
+        return c
 
+    def _add_interaction(self, data: InteractionData, c: dict, now: str) -> dict:
         interaction = {
             "id": str(uuid.uuid4()),
             "customer_id": c["id"],
@@ -216,20 +245,22 @@ class CustomerManager:
             "status": "open",
             "assigned_to": data.assigned_to,
             "reference": data.reference,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
         }
         self._interactions.append(interaction)
+        self._interactions_by_id[interaction["id"]] = interaction
+        self._interactions_by_email.setdefault(data.customer_email, []).append(interaction)
         return interaction
 
     def update_interaction_status(self, interaction_id: str, status: str) -> dict:
         if status not in self.VALID_INTERACTION_STATUS:
             raise ValueError(f"Invalid status: {status}")
-        for i in self._interactions:
-            if i["id"] == interaction_id:
-                i["status"] = status
-                i["updated_at"] = datetime.now(timezone.utc).isoformat()
-                return i
-        raise ValueError(f"Interaction not found: {interaction_id}")
+        i = self._interactions_by_id.get(interaction_id)
+        if not i:
+            raise ValueError(f"Interaction not found: {interaction_id}")
+        i["status"] = status
+        i["updated_at"] = datetime.now(timezone.utc).isoformat()
+        return i
 
     def list_interactions(
         self,
@@ -239,9 +270,10 @@ class CustomerManager:
         sentiment: Optional[str] = None,
         limit: int = 100,
     ) -> list[dict]:
-        result = list(self._interactions)
         if customer_email:
-            result = [i for i in result if i["customer_email"] == customer_email]
+            result = list(self._interactions_by_email.get(customer_email, ()))
+        else:
+            result = list(self._interactions)
         if interaction_type:
             result = [i for i in result if i["interaction_type"] == interaction_type]
         if status:
@@ -275,10 +307,14 @@ class CustomerManager:
             elif return_rate > 0.1:
                 score -= 10
 
-        # Interactions sentiment
-        interactions = self.list_interactions(customer_email=email)
-        neg_count = sum(1 for i in interactions if i["sentiment"] == "negative")
-        pos_count = sum(1 for i in interactions if i["sentiment"] == "positive")
+        # Interactions sentiment, counted in one pass over this customer's log
+        neg_count = pos_count = 0
+        for i in self._interactions_by_email.get(email, ()):
+            sentiment = i["sentiment"]
+            if sentiment == "negative":
+                neg_count += 1
+            elif sentiment == "positive":
+                pos_count += 1
         score += min(10, pos_count * 2)
         score -= min(15, neg_count * 3)
 
@@ -309,10 +345,12 @@ class CustomerManager:
         if total == 0:
             return {"total": 0, "active": 0, "by_tier": {}, "total_revenue": 0.0, "avg_ltv": 0.0}
 
-        active = sum(1 for c in self._customers.values() if c["is_active"])
+        active = 0
         by_tier: dict[str, int] = {}
         total_revenue = 0.0
         for c in self._customers.values():
+            if c["is_active"]:
+                active += 1
             by_tier[c["tier"]] = by_tier.get(c["tier"], 0) + 1
             total_revenue += c["total_spent"]
 
@@ -5,6 +5,9 @@ import io
 import json
 from datetime import datetime
 from decimal import Decimal
+from itertools import repeat
+
+import orjson
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -16,6 +19,13 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _orjson_default(obj):
+    # orjson handles datetimes natively; only Decimals need help
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ExportService:
     """Export data in various formats."""
 
@@ -25,17 +35,20 @@ class ExportService:
             return ""
         cols = columns or list(rows[0].keys())
         buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=cols, extrasaction="ignore")
-        writer.writeheader()
-        for row in rows:
-            clean = {k: (float(v) if isinstance(v, Decimal) else v) for k, v in row.items()}
-            writer.writerow(clean)
+        writer = csv.writer(buf)
+        writer.writerow(cols)
+        # One list per row with just the exported columns, written in a single C call
+        writer.writerows(
+            [float(v) if isinstance(v, Decimal) else v for v in map(row.get, cols, repeat(""))]
+            for row in rows
+        )
         return buf.getvalue()
 
     @staticmethod
     def to_json(rows: list[dict], pretty: bool = False) -> str:
-        indent = 2 if pretty else None
-        return json.dumps(rows, cls=DecimalEncoder, ensure_ascii=False, indent=indent)
+        """JSON array of ``rows``; compact output has no spaces after ``,``/``:``."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(rows, default=_orjson_default, option=option).decode("utf-8")
 
     @staticmethod
     def to_tsv(rows: list[dict], columns: list[str] | None = None) -> str:
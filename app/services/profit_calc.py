@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 
 
 @dataclass
@@ -115,6 +115,42 @@ class ProfitCalculator:
             cost_details=cost_details,
         )
 
+    @staticmethod
+    def calculate_bulk(
+        prices: Sequence[float],
+        product_costs: Sequence[float],
+        costs: Optional[CostBreakdown] = None,
+    ) -> tuple[list[float], list[float], list[float], list[float], list[bool]]:
+        """Profit lanes for many products sharing one cost template.
+
+        ``prices`` are selling prices (USD) and ``product_costs`` purchase costs
+        (CNY); every other cost comes from ``costs``. Uses float arithmetic with
+        the template folded into per-call constants, so results are rounded to
+        the cent like ``calculate`` but may differ from it by one cent on ties.
+        Returns (total_cost, net_profit, net_margin_pct, roi_pct, profitable).
+        """
+        c = costs or CostBreakdown()
+        fx = float(c.fx_rate)
+        cost_factor = (1 + float(c.customs_duty_pct) / 100) / fx
+        fixed = (
+            float(c.shipping_domestic + c.packaging) / fx
+            + float(c.shipping_intl + c.ad_cost + c.fba_fee)
+        )
+        price_pct = float(c.platform_fee_pct + c.vat_pct + c.return_rate_pct) / 100
+
+        total_costs, net_profits, margins, rois, profitable = [], [], [], [], []
+        for sp, pc in zip(prices, product_costs):
+            total = pc * cost_factor + fixed + sp * price_pct
+            net = sp - total
+            net_cents = round(net, 2)
+            total_costs.append(round(total, 2))
+            net_profits.append(net_cents)
+            margins.append(round(net / sp * 100, 2) if sp else 0.0)
+            rois.append(round(net / total * 100, 2) if total else 0.0)
+            # Judged on the rounded profit, as ProfitReport.is_profitable is
+            profitable.append(net_cents > 0)
+        return total_costs, net_profits, margins, rois, profitable
+
     @staticmethod
     def batch_calculate(
         products: list[dict],
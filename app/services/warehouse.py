@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
 
 @dataclass
 class WarehouseInfo:
@@ -61,6 +63,14 @@ class WarehouseManager:
         self._adjustments: list[dict] = []
         self._inventory: dict[str, dict[str, int]] = {}  # {warehouse_code: {sku: qty}}
         self._transfer_counter = 0
+        # Bumped on every warehouse/stock write; read-side snapshots are
+        # rebuilt only when it has moved on since they were taken.
+        self._version = 0
+        self._summary: Optional[tuple[int, dict]] = None
+        self._transfer_list: Optional[tuple[int, list[dict]]] = None
+        self._adjustment_list: Optional[tuple[int, list[dict]]] = None
+        # Encoded list_warehouses responses keyed by filter arguments
+        self._list_cache: dict[tuple, bytes] = {}
 
     def create_warehouse(self, info: WarehouseInfo) -> WarehouseInfo:
         """Create or update a warehouse."""
@@ -71,6 +81,8 @@ class WarehouseManager:
         info.id = info.id or str(uuid.uuid4())
         info.created_at = info.created_at or datetime.now(timezone.utc).isoformat()
         self._warehouses[info.code] = info
+        self._version += 1
+        self._list_cache.clear()
         if info.code not in self._inventory:
             self._inventory[info.code] = {}
         return info
@@ -94,11 +106,47 @@ class WarehouseManager:
             result = [w for w in result if w.country == country]
         return result
 
+    def list_warehouses_json(
+        self,
+        active_only: bool = True,
+        warehouse_type: Optional[str] = None,
+        country: Optional[str] = None,
+    ) -> bytes:
+        """JSON array of warehouse list entries, cached until a warehouse changes.
+
+        Only filters that match at least one warehouse are cached, so the
+        cache is bounded by the warehouse data rather than by query strings.
+        """
+        if warehouse_type and warehouse_type not in self.VALID_TYPES:
+            return b"[]"
+        key = (active_only, warehouse_type, country)
+        body = self._list_cache.get(key)
+        if body is None:
+            rows = [
+                {
+                    "code": w.code,
+                    "name": w.name,
+                    "warehouse_type": w.warehouse_type,
+                    "country": w.country,
+                    "city": w.city,
+                    "is_active": w.is_active,
+                    "capacity_units": w.capacity_units,
+                }
+                for w in self.list_warehouses(active_only, warehouse_type, country)
+            ]
+            if not rows:
+                return b"[]"
+            body = orjson.dumps(rows)
+            self._list_cache[key] = body
+        return body
+
     def deactivate_warehouse(self, code: str) -> bool:
         wh = self._warehouses.get(code)
         if not wh:
             return False
         wh.is_active = False
+        self._version += 1
+        self._list_cache.clear()
         return True
 
     def set_stock(self, warehouse_code: str, sku: str, quantity: int) -> None:
@@ -106,6 +154,7 @@ class WarehouseManager:
         if warehouse_code not in self._inventory:
             self._inventory[warehouse_code] = {}
         self._inventory[warehouse_code][sku] = max(0, quantity)
+        self._version += 1
 
     def get_stock(self, warehouse_code: str, sku: str) -> int:
         return self._inventory.get(warehouse_code, {}).get(sku, 0)
@@ -160,6 +209,7 @@ class WarehouseManager:
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
         self._transfers[transfer_number] = transfer
+        self._version += 1
         return transfer
 
     def approve_transfer(self, transfer_number: str) -> dict:
@@ -176,6 +226,7 @@ class WarehouseManager:
             self.set_stock(transfer["source_warehouse"], item["sku"], current - item["quantity"])
 
         transfer["status"] = "approved"
+        self._version += 1
         return transfer
 
     def ship_transfer(self, transfer_number: str, tracking: str = "", carrier: str = "") -> dict:
@@ -188,6 +239,7 @@ class WarehouseManager:
         transfer["tracking_number"] = tracking
         transfer["shipping_carrier"] = carrier
         transfer["shipped_at"] = datetime.now(timezone.utc).isoformat()
+        self._version += 1
         return transfer
 
     def receive_transfer(self, transfer_number: str) -> dict:
@@ -205,6 +257,7 @@ class WarehouseManager:
 
         transfer["status"] = "received"
         transfer["received_at"] = datetime.now(timezone.utc).isoformat()
+        self._version += 1
         return transfer
 
     def cancel_transfer(self, transfer_number: str) -> dict:
@@ -225,6 +278,7 @@ class WarehouseManager:
                 )
 
         transfer["status"] = "cancelled"
+        self._version += 1
         return transfer
 
     def get_transfer(self, transfer_number: str) -> Optional[dict]:
@@ -235,7 +289,14 @@ class WarehouseManager:
         status: Optional[str] = None,
         warehouse_code: Optional[str] = None,
     ) -> list[dict]:
-        result = list(self._transfers.values())
+        """List transfers with optional filters.
+
+        The unfiltered list is shared between calls until the next write;
+        treat it as read-only.
+        """
+        if self._transfer_list is None or self._transfer_list[0] != self._version:
+            self._transfer_list = (self._version, list(self._transfers.values()))
+        result = self._transfer_list[1]
         if status:
             result = [t for t in result if t["status"] == status]
         if warehouse_code:
@@ -271,6 +332,7 @@ class WarehouseManager:
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
         self._adjustments.append(adj)
+        self._version += 1
         return adj
 
     def list_adjustments(
@@ -279,7 +341,14 @@ class WarehouseManager:
         sku: Optional[str] = None,
         adjustment_type: Optional[str] = None,
     ) -> list[dict]:
-        result = list(self._adjustments)
+        """List adjustments with optional filters.
+
+        The unfiltered list is shared between calls until the next write;
+        treat it as read-only.
+        """
+        if self._adjustment_list is None or self._adjustment_list[0] != self._version:
+            self._adjustment_list = (self._version, list(self._adjustments))
+        result = self._adjustment_list[1]
         if warehouse_code:
             result = [a for a in result if a["warehouse_code"] == warehouse_code]
         if sku:
@@ -289,7 +358,13 @@ class WarehouseManager:
         return result
 
     def inventory_summary(self) -> dict:
-        """Summary: total SKUs, total units, by warehouse."""
+        """Summary: total SKUs, total units, by warehouse.
+
+        The result is shared between calls until the next write; treat it as
+        read-only.
+        """
+        if self._summary is not None and self._summary[0] == self._version:
+            return self._summary[1]
         all_skus = set()
         total_units = 0
         by_warehouse = {}
@@ -301,12 +376,14 @@ class WarehouseManager:
             }
             all_skus.update(stock.keys())
             total_units += wh_total
-        return {
+        summary = {
             "total_skus": len(all_skus),
             "total_units": total_units,
             "warehouse_count": len(self._warehouses),
             "by_warehouse": by_warehouse,
         }
+        self._summary = (self._version, summary)
+        return summary
 
     def low_stock_alerts(self, threshold: int = 10) -> list[dict]:
         """Find SKUs below threshold across warehouses."""
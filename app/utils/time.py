@@ -0,0 +1,10 @@
+"""Timestamp helpers shared by the models."""
+
+from datetime import datetime, timezone
+
+_UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time; the column default for every model."""
+    return datetime.now(_UTC)
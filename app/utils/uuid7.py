@@ -0,0 +1,36 @@
+"""Time-ordered UUIDv7 generator (RFC 9562).
+
+Layout: 48-bit Unix timestamp in milliseconds, 4-bit version, 12-bit
+counter, 2-bit variant, 62 random bits. The counter is re-seeded randomly
+each millisecond and incremented for further calls within the same one,
+so values from one process are strictly increasing.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Same (or earlier, if the clock stepped back) millisecond.
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    rand = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand
+    return uuid.UUID(int=value)
@@ -8,6 +8,8 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.api.dashboard import reset_stats_cache
+from app.api.reports import reset_report_cache
 from app.database import Base, get_db
 from app.main import app
 
@@ -58,8 +60,10 @@ def _reset_rate_limiter():
 
 @pytest_asyncio.fixture(autouse=True)
 async def reset_rate_limits():
-    """Auto-reset rate limiter before each test."""
+    """Auto-reset rate limiter and response caches before each test."""
     _reset_rate_limiter()
+    reset_stats_cache()
+    reset_report_cache()
     yield
 
 
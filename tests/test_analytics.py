@@ -1,5 +1,6 @@
 """Tests for the analytics engine."""
 
+import orjson
 import pytest
 from datetime import date, datetime, timezone
 from decimal import Decimal
@@ -164,6 +165,18 @@ class TestAggregate:
         jan = metrics[0]
         assert jan.unique_customers == 2  # Alice and Bob
 
+    def test_mixed_total_types_sum_exactly(self, engine):
+        orders = [
+            {"created_at": "2026-01-05", "total": 0.1},
+            {"created_at": "2026-01-06", "total": "0.2"},
+            {"created_at": "2026-01-07", "total": Decimal("1.15")},
+            {"created_at": "2026-01-08", "total": 3, "status": "refunded"},
+        ]
+        jan = engine.aggregate(orders, Period.MONTHLY)[0]
+        assert str(jan.gross_revenue) == "1.45"
+        assert str(jan.net_revenue) == "-1.55"
+        assert str(jan.refund_amount) == "3.00"
+
     def test_empty_orders(self, engine):
         metrics = engine.aggregate([], Period.MONTHLY)
         assert metrics == []
@@ -393,6 +406,10 @@ class TestFullReport:
         d = engine.report_to_dict(report)
         assert int(d["summary"]["total_orders"]) >= 3
 
+    def test_report_to_json_matches_dict(self, engine, sample_orders):
+        report = engine.generate_report(sample_orders)
+        assert orjson.loads(engine.report_to_json(report)) == engine.report_to_dict(report)
+
 
 # ── Date Extraction ─────────────────────────────────────
 
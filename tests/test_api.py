@@ -1,5 +1,6 @@
 """Extended API tests for v2.0."""
 
+import orjson
 import pytest
 from httpx import AsyncClient
 
@@ -112,6 +113,18 @@ async def test_filter_orders_by_platform(client: AsyncClient):
     assert resp.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_order_status_by_name_or_code(client: AsyncClient):
+    create = await client.post("/api/v1/orders/", json={"platform": "manual"})
+    oid = create.json()["id"]
+    resp = await client.patch(f"/api/v1/orders/{oid}", json={"status": 2})
+    assert resp.json()["status"] == "shipped"
+    resp = await client.get("/api/v1/orders/?status=shipped")
+    assert [o["id"] for o in resp.json()] == [oid]
+    assert (await client.get("/api/v1/orders/?status=2")).json() == resp.json()
+    assert (await client.get("/api/v1/orders/?status=bogus")).status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_dashboard_stats(client: AsyncClient):
     resp = await client.get("/api/v1/dashboard/stats")
@@ -123,6 +136,15 @@ async def test_dashboard_stats(client: AsyncClient):
     assert "total_suppliers" in data
 
 
+@pytest.mark.asyncio
+async def test_dashboard_stats_etag(client: AsyncClient):
+    resp = await client.get("/api/v1/dashboard/stats")
+    etag = resp.headers["etag"]
+    resp = await client.get("/api/v1/dashboard/stats", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+
+
 @pytest.mark.asyncio
 async def test_create_supplier(client: AsyncClient):
     payload = {
@@ -151,6 +173,23 @@ async def test_delete_supplier(client: AsyncClient):
     assert resp.status_code == 204
 
 
+@pytest.mark.asyncio
+async def test_purchase_order_items_round_trip(client: AsyncClient):
+    supplier = await client.post("/api/v1/suppliers/", json={"name": "PO Supplier"})
+    payload = {
+        "supplier_id": supplier.json()["id"],
+        "items": [{"sku": "PO-A", "quantity": 2, "unit_cost": 1.5}, {"sku": "PO-B", "quantity": 4, "unit_cost": 3}],
+    }
+    resp = await client.post("/api/v1/purchase-orders/", json=payload)
+    assert resp.status_code == 201
+    po = resp.json()
+    assert po["total_cost"] == 15.0
+    assert [i["sku"] for i in po["items"]] == ["PO-A", "PO-B"]
+
+    listed = await client.get("/api/v1/purchase-orders/")
+    assert listed.json()[0]["items"] == po["items"]
+
+
 @pytest.mark.asyncio
 async def test_inventory_list(client: AsyncClient):
     resp = await client.get("/api/v1/inventory/")
@@ -167,6 +206,34 @@ async def test_reports_overview(client: AsyncClient):
     assert "top_products" in data
 
 
+@pytest.mark.asyncio
+async def test_reports_overview_cache_invalidated_on_write(client: AsyncClient):
+    resp = await client.get("/api/v1/reports/overview")
+    etag = resp.headers["etag"]
+    resp = await client.get("/api/v1/reports/overview", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    await client.post("/api/v1/products/", json={"sku": "RPT-001", "title": "Cached"})
+    resp = await client.get("/api/v1/reports/overview", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["total_products"] == 1
+    assert resp.headers["cache-control"].startswith("private")
+
+
+def test_report_cache_skips_store_after_clear():
+    from starlette.requests import Request
+
+    from app.cache import ResponseCache
+
+    cache = ResponseCache()
+    request = Request({"type": "http", "path": "/reports/overview", "query_string": b"", "headers": []})
+    generation = cache.generation
+    cache.clear()  # a commit lands while the handler awaits the database
+    cache.store(request, {"stale": True}, ttl=60, generation=generation)
+    assert cache.lookup(request) is None
+    cache.store(request, {"stale": False}, ttl=60, generation=cache.generation)
+    assert cache.lookup(request) is not None
+
+
 @pytest.mark.asyncio
 async def test_reports_profit(client: AsyncClient):
     await client.post("/api/v1/products/", json={
@@ -177,6 +244,20 @@ async def test_reports_profit(client: AsyncClient):
     assert resp.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_reports_profit_stream_matches_cached(client: AsyncClient):
+    await client.post("/api/v1/products/", json={
+        "sku": "PROFIT-SUBCENT", "title": "Sub-cent profit",
+        "cost_price": "0", "retail_price": "0.09",
+    })
+    rows = (await client.get("/api/v1/reports/profit")).json()
+    resp = await client.get("/api/v1/reports/profit", params={"stream": "true"})
+    streamed = [orjson.loads(line) for line in resp.content.splitlines()]
+    assert streamed == rows
+    assert rows[0]["net_profit"] == 0.0
+    assert rows[0]["is_profitable"] is False
+
+
 @pytest.mark.asyncio
 async def test_reports_sales_trends(client: AsyncClient):
     resp = await client.get("/api/v1/reports/sales-trends")
@@ -201,3 +282,15 @@ async def test_auth_login_wrong_credentials(client: AsyncClient):
 async def test_auth_me_no_token(client: AsyncClient):
     resp = await client.get("/api/v1/auth/me")
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_filter_orders_by_number_prefix(client: AsyncClient):
+    order = (await client.post("/api/v1/orders/", json={"platform": "manual"})).json()
+    await client.post("/api/v1/orders/", json={"platform": "manual"})
+    number = order["order_number"]
+    resp = await client.get(f"/api/v1/orders/?order_number={number[:-2]}")
+    assert order["id"] in [o["id"] for o in resp.json()]
+    resp = await client.get(f"/api/v1/orders/?order_number={number}")
+    assert [o["id"] for o in resp.json()] == [order["id"]]
+    assert (await client.get("/api/v1/orders/?order_number=ORD_")).json() == []
@@ -47,6 +47,12 @@ class TestJWT:
         payload = decode_token(token)
         assert payload["exp"] - payload["iat"] <= 300 + 1
 
+    def test_decode_returns_independent_copies(self):
+        token = create_access_token({"sub": "test"})
+        first = decode_token(token)
+        first["sub"] = "changed"
+        assert decode_token(token)["sub"] == "test"
+
     def test_invalid_token_raises(self):
         from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
@@ -0,0 +1,23 @@
+"""Bulk import/export service tests."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from app.services.bulk_ops import BulkExporter
+
+
+class TestProductsJSON:
+    def test_streamed_json_matches_products_to_json(self):
+        products = [
+            {"sku": "A-1", "title": "Line\nbreak", "retail_price": Decimal("9.99"),
+             "created_at": datetime(2024, 1, 1), "meta": {1: "x"}},
+            {"sku": "B-2", "tags": ["a", "b"], "dims": {}},
+        ]
+        for pretty in (True, False):
+            streamed = b"".join(BulkExporter.iter_products_json(products, pretty)).decode()
+            assert streamed == BulkExporter.products_to_json(products, pretty)
+
+    def test_streamed_json_empty(self):
+        for pretty in (True, False):
+            assert b"".join(BulkExporter.iter_products_json([], pretty)) == b"[]"
+            assert BulkExporter.products_to_json([], pretty) == "[]"
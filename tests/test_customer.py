@@ -145,6 +145,21 @@ class TestOrderTracking:
         with pytest.raises(ValueError, match="not found"):
             mgr.record_order("nope@nope.com", 10.0)
 
+    def test_bulk_record_orders(self, mgr_with_customers):
+        rows = mgr_with_customers.bulk_record_orders([
+            ("alice@example.com", 20.0), ("bob@example.com", 5.0), ("alice@example.com", 30.0),
+        ])
+        alice = mgr_with_customers.get_customer("alice@example.com")
+        assert rows[2] is alice
+        assert alice["total_orders"] == 2
+        assert alice["avg_order_value"] == 25.0
+        assert alice["first_order_at"] == alice["last_order_at"] == rows[1]["last_order_at"]
+
+    def test_bulk_record_orders_all_or_nothing(self, mgr_with_customers):
+        with pytest.raises(ValueError, match="not found"):
+            mgr_with_customers.bulk_record_orders([("alice@example.com", 20.0), ("nope@nope.com", 1.0)])
+        assert mgr_with_customers.get_customer("alice@example.com")["total_orders"] == 0
+
 
 class TestListAndSearch:
     def test_list_all(self, mgr_with_customers):
@@ -72,6 +72,26 @@ class TestProfitCalculator:
         assert len(reports) == 3
         assert all(isinstance(r, ProfitReport) for r in reports)
 
+    def test_calculate_bulk_matches_scalar(self):
+        costs = CostBreakdown(fx_rate=Decimal("7.25"), platform_fee_pct=Decimal("15"))
+        prices, product_costs = [19.99, 9.99, 49.0], [50.0, 60.0, 100.0]
+        totals, nets, margins, rois, profitable = ProfitCalculator.calculate_bulk(prices, product_costs, costs)
+        for i, (sp, pc) in enumerate(zip(prices, product_costs)):
+            costs.product_cost = Decimal(str(pc))
+            report = ProfitCalculator.calculate(Decimal(str(sp)), costs)
+            assert abs(totals[i] - float(report.total_cost)) <= 0.01
+            assert abs(nets[i] - float(report.net_profit)) <= 0.01
+            assert abs(margins[i] - float(report.net_margin_pct)) <= 0.01
+            assert abs(rois[i] - float(report.roi_pct)) <= 0.01
+            assert profitable[i] == report.is_profitable
+
+    def test_calculate_bulk_sub_cent_profit_not_profitable(self):
+        # Net profit is about 0.0048: it rounds to 0.00 on both paths
+        _, nets, _, _, profitable = ProfitCalculator.calculate_bulk([0.09], [0.0])
+        report = ProfitCalculator.calculate(Decimal("0.09"), CostBreakdown())
+        assert nets[0] == float(report.net_profit) == 0.0
+        assert profitable[0] is report.is_profitable is False
+
     def test_roi_calculation(self):
         costs = CostBreakdown(
             product_cost=Decimal("50"),
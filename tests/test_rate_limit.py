@@ -29,6 +29,12 @@ class TestRateLimiter:
         rl.allow("x")
         assert rl.remaining("x") == 4
 
+    def test_acquire_returns_remaining(self):
+        rl = RateLimiter(requests_per_minute=60, burst=2)
+        assert rl.acquire("x") == (True, 1)
+        assert rl.acquire("x") == (True, 0)
+        assert rl.acquire("x") == (False, 0)
+
     def test_reset_single_key(self):
         rl = RateLimiter(requests_per_minute=60, burst=2)
         rl.allow("a")
@@ -51,5 +57,5 @@ class TestRateLimiter:
         rl.allow("t")
         assert rl.allow("t") is False
         # Simulate time passing by modifying internal state
-        rl._buckets["t"]["last"] -= 1  # 1 second ago
+        rl._last["t"] -= 1  # 1 second ago
         assert rl.allow("t") is True  # Should have refilled
@@ -0,0 +1,23 @@
+"""UUIDv7 generator tests."""
+
+import time
+
+from app.utils.uuid7 import uuid7
+
+
+class TestUUID7:
+    def test_version_and_variant(self):
+        u = uuid7()
+        assert u.version == 7
+        assert u.variant == "specified in RFC 4122"
+
+    def test_embeds_current_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        u = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= u.int >> 80 <= after
+
+    def test_strictly_increasing(self):
+        ids = [uuid7() for _ in range(5000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
@@ -78,6 +78,21 @@ class TestWarehouseCRUD:
         active = mgr_with_warehouses.list_warehouses(active_only=True)
         assert all(w.code != "SZ-01" for w in active)
 
+    def test_list_json_invalidated_on_deactivate(self, mgr_with_warehouses):
+        body = mgr_with_warehouses.list_warehouses_json()
+        assert mgr_with_warehouses.list_warehouses_json() is body
+        assert b'"SZ-01"' in body
+        mgr_with_warehouses.deactivate_warehouse("SZ-01")
+        assert b'"SZ-01"' not in mgr_with_warehouses.list_warehouses_json()
+
+    def test_list_json_unknown_filters_not_cached(self, mgr_with_warehouses):
+        for i in range(50):
+            assert mgr_with_warehouses.list_warehouses_json(country=f"X{i}") == b"[]"
+            assert mgr_with_warehouses.list_warehouses_json(warehouse_type=f"t{i}") == b"[]"
+        assert mgr_with_warehouses._list_cache == {}
+        mgr_with_warehouses.list_warehouses_json(country="US")
+        assert len(mgr_with_warehouses._list_cache) == 1
+
     def test_deactivate_nonexistent(self, mgr):
         assert not mgr.deactivate_warehouse("NOPE")
 
@@ -222,6 +237,18 @@ class TestStockTransfer:
         assert len(mgr_with_warehouses.list_transfers()) == 2
         assert len(mgr_with_warehouses.list_transfers(warehouse_code="LA-01")) == 1
 
+    def test_list_transfers_refreshed_after_write(self, mgr_with_warehouses):
+        mgr_with_warehouses.set_stock("SZ-01", "SKU-001", 100)
+        req = TransferRequest(
+            source_warehouse="SZ-01", dest_warehouse="LA-01",
+            items=[{"sku": "SKU-001", "quantity": 10}],
+        )
+        mgr_with_warehouses.create_transfer(req)
+        first = mgr_with_warehouses.list_transfers()
+        assert mgr_with_warehouses.list_transfers() is first
+        mgr_with_warehouses.create_transfer(req)
+        assert len(mgr_with_warehouses.list_transfers()) == 2
+
     def test_get_transfer(self, mgr_with_warehouses):
         mgr_with_warehouses.set_stock("SZ-01", "SKU-001", 100)
         t = mgr_with_warehouses.create_transfer(TransferRequest(
@@ -287,6 +314,16 @@ class TestStockAdjustment:
         assert len(mgr_with_warehouses.list_adjustments(sku="SKU-001")) == 1
         assert len(mgr_with_warehouses.list_adjustments(adjustment_type="audit")) == 1
 
+    def test_list_adjustments_refreshed_after_write(self, mgr_with_warehouses):
+        req = AdjustmentRequest(
+            warehouse_code="SZ-01", sku="SKU-001", adjustment_type="audit", quantity_change=5,
+        )
+        mgr_with_warehouses.create_adjustment(req)
+        first = mgr_with_warehouses.list_adjustments()
+        assert mgr_with_warehouses.list_adjustments() is first
+        mgr_with_warehouses.create_adjustment(req)
+        assert len(mgr_with_warehouses.list_adjustments()) == 2
+
 
 class TestInventorySummary:
     def test_empty_summary(self, mgr):
@@ -303,6 +340,13 @@ class TestInventorySummary:
         assert s["total_units"] == 175
         assert s["warehouse_count"] == 3
 
+    def test_summary_refreshed_after_write(self, mgr_with_warehouses):
+        mgr_with_warehouses.set_stock("SZ-01", "SKU-001", 10)
+        first = mgr_with_warehouses.inventory_summary()
+        assert mgr_with_warehouses.inventory_summary() is first
+        mgr_with_warehouses.set_stock("SZ-01", "SKU-001", 30)
+        assert mgr_with_warehouses.inventory_summary()["total_units"] == 30
+
     def test_low_stock_alerts(self, mgr_with_warehouses):
         mgr_with_warehouses.set_stock("SZ-01", "SKU-001", 5)
         mgr_with_warehouses.set_stock("SZ-01", "SKU-002", 100)